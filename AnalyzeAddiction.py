@@ -1,5 +1,3 @@
-import plotly.graph_objects as go
-
 class AddictionAnalyzer:
     """Class to handle addiction level analysis"""
     
@@ -21,6 +19,7 @@ class ChartGenerator:
     @staticmethod
     def create_gauge_chart(score):
         """Create a gauge chart for addiction score"""
+        import plotly.graph_objects as go
         fig = go.Figure(go.Indicator(
             mode = "gauge+number+delta",
             value = score,
@@ -50,6 +49,7 @@ class ChartGenerator:
     @staticmethod
     def create_comparison_chart(user_data, avg_data):
         """Create comparison chart between user and average"""
+        import plotly.graph_objects as go
         categories = ['Daily Usage', 'Sleep Hours', 'Mental Health', 'Conflicts']
         
         fig = go.Figure()
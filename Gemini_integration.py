@@ -1,135 +1,282 @@
 from AnalyzeAddiction import AddictionAnalyzer
 from config import Config
-from google import genai
+from responseCache import ResponseCache
+from reportGenerator import ReportWorker
 
-from fpdf import FPDF
-import os
-from datetime import datetime
+import threading
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 
-class PDFGenerator:
-    @staticmethod
-    def generate_report(user_input, prediction_score, addiction_level, ai_response):
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_auto_page_break(auto=True, margin=15)
+class AnalysisStream:
+    """Handle on a streamed Gemini response that any number of readers can follow"""
 
-        font_path = "fonts/DejaVuSans.ttf" 
-        pdf.add_font("DejaVu", "", font_path, uni=True)
-        pdf.set_font("DejaVu", "", 14)
+    def __init__(self):
+        self._chunks = []
+        self._done = False
+        self._success = False
+        self._error = None
+        self._condition = threading.Condition()
 
-        pdf.set_font("DejaVu", "", 16)
-        pdf.cell(0, 10, "Social Media Addiction Analysis Report", ln=True, align='C')
-        
-        pdf.set_font("DejaVu", "", 12)
-        pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
-        pdf.ln(10)
+    @staticmethod
+    def completed(text):
+        stream = AnalysisStream()
+        stream.append(text)
+        stream.finish(True)
+        return stream
+
+    def append(self, chunk):
+        with self._condition:
+            self._chunks.append(chunk)
+            self._condition.notify_all()
 
-        pdf.set_font("DejaVu", "", 14)
-        pdf.cell(0, 10, "User Profile", ln=True)
-        pdf.set_font("DejaVu", "", 12)
-        for key, value in user_input.items():
-            pdf.cell(0, 8, f"{key.replace('_', ' ')}: {value}", ln=True)
-        pdf.ln(5)
+    def finish(self, success, error=None):
+        with self._condition:
+            self._success = success
+            self._error = error
+            self._done = True
+            self._condition.notify_all()
 
-        pdf.set_font("DejaVu", "", 14)
-        pdf.cell(0, 10, "Prediction Results", ln=True)
-        pdf.set_font("DejaVu", "", 12)
-        pdf.cell(0, 8, f"Addiction Score: {prediction_score:.1f}/10", ln=True)
-        pdf.cell(0, 8, f"Addiction Level: {addiction_level}", ln=True)
-        pdf.ln(5)
+    def done(self):
+        return self._done
 
-        pdf.set_font("DejaVu", "", 14)
-        pdf.cell(0, 10, "AI Personalized Analysis", ln=True)
-        pdf.set_font("DejaVu", "", 12)
-        for line in ai_response.split("\n"):
-            pdf.multi_cell(0, 8, line)
+    def text(self):
+        with self._condition:
+            return "".join(self._chunks)
 
-        os.makedirs("reports", exist_ok=True)
-        file_path = os.path.join("reports", f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-        pdf.output(file_path)
-        return file_path
+    def iter_chunks(self):
+        """Yield chunks from the start of the response as they arrive"""
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self._chunks) and not self._done:
+                    self._condition.wait()
+                new_chunks = self._chunks[index:]
+                done = self._done
+            index += len(new_chunks)
+            yield from new_chunks
+            if done and index >= len(self._chunks):
+                return
 
+    def result(self):
+        """Block until the response is complete and return (text, success)"""
+        with self._condition:
+            while not self._done:
+                self._condition.wait()
+        if self._success:
+            return self.text(), True
+        return self._error, False
 
 
 class GeminiAI:
     """Class to handle Gemini AI integration using the official genai.Client"""
 
-    client = genai.Client(api_key=Config.GEMINI_API_KEY)
+    # Created on first use so importing this module does not pay for google.genai
+    client = None
+    _client_lock = threading.Lock()
+
+    # Bump whenever a prompt template changes so cached responses are not reused
+    PROMPT_VERSION = 1
+
+    PRESET_FOLLOW_UPS = {
+        "Academic Impact": "How can I minimize social media's impact on my academic performance?",
+        "Sleep & Usage": "How can I improve my sleep while managing social media use?",
+        "Mental Health": "What strategies can help improve my mental health related to social media use?"
+    }
+
+    cache = ResponseCache(
+        max_entries=Config.GEMINI_CACHE_SIZE,
+        ttl_seconds=Config.GEMINI_CACHE_TTL,
+        persist_path=Config.GEMINI_CACHE_FILE
+    )
+
+    _executor = ThreadPoolExecutor(max_workers=Config.GEMINI_MAX_CONCURRENCY, thread_name_prefix="gemini")
+    _in_flight = {}
+    _in_flight_lock = threading.RLock()
 
     @staticmethod
-    def query_gemini_api(user_input, prediction_score):
-        """Query Gemini AI API with prediction results for personalized advice"""
+    def get_client():
+        """Return the shared genai.Client, creating it on first use"""
+        with GeminiAI._client_lock:
+            if GeminiAI.client is None:
+                from google import genai
+                GeminiAI.client = genai.Client(api_key=Config.GEMINI_API_KEY)
+            return GeminiAI.client
+
+    @staticmethod
+    def make_cache_key(kind, user_input, prediction_score, question=None):
+        """Key a response on everything its prompt is rendered from"""
+        addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
+        return ResponseCache.make_key(
+            kind, GeminiAI.PROMPT_VERSION, dict(user_input),
+            f"{prediction_score:.1f}", addiction_level, question
+        )
+
+    @staticmethod
+    def build_analysis_prompt(user_input, prediction_score):
+        """Render the personalized analysis prompt"""
+        addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
+
+        return f"""
+        I am a social media addiction prediction system. Here are the results for a user:
+
+        User Profile:
+        - Age: {user_input['Age']} years old
+        - Gender: {user_input['Gender']}
+        - Academic Level: {user_input['Academic_Level']}
+        - Country: {user_input['Country']}
+        - Daily Social Media Usage: {user_input['Avg_Daily_Usage_Hours']} hours
+        - Most Used Platform: {user_input['Most_Used_Platform']}
+        - Affects Academic Performance: {user_input['Affects_Academic_Performance']}
+        - Sleep Hours: {user_input['Sleep_Hours_Per_Night']} hours per night
+        - Mental Health Score: {user_input['Mental_Health_Score']}/10
+        - Social Media Conflicts: {user_input['Conflicts_Over_Social_Media']} incidents
+
+        Prediction Results:
+        - Addiction Score: {prediction_score:.1f}/10
+        - Addiction Level: {addiction_level}
+
+        Please provide:
+        1. A personalized analysis of this user's social media habits
+        2. Specific, actionable recommendations for improvement
+        3. Potential risks or concerns based on their profile
+        4. Positive aspects of their current habits (if any)
+        5. Long-term strategies for maintaining healthy social media use
+
+        Keep the response as brief as possible but easy to understand, and make it encouraging and supportive.
+        """
+
+    @staticmethod
+    def build_follow_up_prompt(user_input, prediction_score, custom_question):
+        """Render the follow-up question prompt"""
+        addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
+
+        return f"""
+        You are an AI assistant helping with social media addiction analysis. 
+
+        User's Profile Summary:
+        - Age: {user_input['Age']}, Gender: {user_input['Gender']}
+        - Daily Usage: {user_input['Avg_Daily_Usage_Hours']} hours
+        - Addiction Score: {prediction_score:.1f}/10 ({addiction_level} level)
+        - Most Used Platform: {user_input['Most_Used_Platform']}
+        - Academic Impact: {user_input['Affects_Academic_Performance']}
+        - Sleep: {user_input['Sleep_Hours_Per_Night']} hours
+        - Mental Health: {user_input['Mental_Health_Score']}/10
+
+        User's Question: {custom_question}
+
+        Please provide a helpful, personalized response based on their social media usage profile.
+        """
+
+    @staticmethod
+    def start_analysis(user_input, prediction_score):
+        """Start (or join) the streamed analysis request in the background and return its AnalysisStream.
+
+        Reruns asking for the same analysis get the in-flight stream instead of a
+        second request; finished analyses come straight from the response cache.
+        """
+        cache_key = GeminiAI.make_cache_key("analysis", user_input, prediction_score)
+        cached = GeminiAI.cache.get(cache_key)
+        if cached is not None:
+            return AnalysisStream.completed(cached['text'])
+
+        with GeminiAI._in_flight_lock:
+            stream = GeminiAI._in_flight.get(cache_key)
+            if stream is None:
+                stream = AnalysisStream()
+                GeminiAI._in_flight[cache_key] = stream
+                GeminiAI._executor.submit(
+                    GeminiAI._run_analysis, stream, cache_key, dict(user_input), prediction_score
+                )
+            return stream
+
+    @staticmethod
+    def _run_analysis(stream, cache_key, user_input, prediction_score):
         try:
-            addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
-
-            prompt = f"""
-            I am a social media addiction prediction system. Here are the results for a user:
-
-            User Profile:
-            - Age: {user_input['Age']} years old
-            - Gender: {user_input['Gender']}
-            - Academic Level: {user_input['Academic_Level']}
-            - Country: {user_input['Country']}
-            - Daily Social Media Usage: {user_input['Avg_Daily_Usage_Hours']} hours
-            - Most Used Platform: {user_input['Most_Used_Platform']}
-            - Affects Academic Performance: {user_input['Affects_Academic_Performance']}
-            - Sleep Hours: {user_input['Sleep_Hours_Per_Night']} hours per night
-            - Mental Health Score: {user_input['Mental_Health_Score']}/10
-            - Social Media Conflicts: {user_input['Conflicts_Over_Social_Media']} incidents
-
-            Prediction Results:
-            - Addiction Score: {prediction_score:.1f}/10
-            - Addiction Level: {addiction_level}
-
-            Please provide:
-            1. A personalized analysis of this user's social media habits
-            2. Specific, actionable recommendations for improvement
-            3. Potential risks or concerns based on their profile
-            4. Positive aspects of their current habits (if any)
-            5. Long-term strategies for maintaining healthy social media use
-
-            Keep the response as brief as possible but easy to understand, and make it encouraging and supportive.
-            """
-
-            response = GeminiAI.client.models.generate_content(
-                model="gemini-1.5-flash",  
-                contents=prompt
+            response = GeminiAI.get_client().models.generate_content_stream(
+                model="gemini-1.5-flash",
+                contents=GeminiAI.build_analysis_prompt(user_input, prediction_score)
             )
-            PDFGenerator.generate_report(user_input, prediction_score, addiction_level, response.text)
-            return response.text, True
-
+            for chunk in response:
+                if chunk.text:
+                    stream.append(chunk.text)
+            text = stream.text()
+            GeminiAI.cache.set(cache_key, {'text': text})
+            stream.finish(True)
         except Exception as e:
-            return f"Error: {str(e)}", False
+            stream.finish(False, f"Error: {str(e)}")
+            return
+        finally:
+            with GeminiAI._in_flight_lock:
+                GeminiAI._in_flight.pop(cache_key, None)
+        
+        # The analysis already succeeded; a failure to queue its PDF must not mark it as failed,
+        # and the results page requests the report again when it offers the download
+        try:
+            GeminiAI.request_report(user_input, prediction_score, text)
+        except Exception as e:
+            warnings.warn(f"Could not queue the PDF report: {str(e)}", RuntimeWarning)
+
+    @staticmethod
+    def request_report(user_input, prediction_score, ai_response):
+        """Queue the PDF report for an analysis in the background and return its job handle"""
+        addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
+        job_id = GeminiAI.make_cache_key("analysis", user_input, prediction_score)
+        return ReportWorker.submit(job_id, user_input, prediction_score, addiction_level, ai_response)
+
+    @staticmethod
+    def query_gemini_api(user_input, prediction_score):
+        """Query Gemini AI API with prediction results for personalized advice"""
+        return GeminiAI.start_analysis(user_input, prediction_score).result()
 
     @staticmethod
     def create_follow_up_query(user_input, prediction_score, custom_question):
         """Handle follow-up questions from the user using Gemini client"""
         try:
-            addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
-
-            prompt_text = f"""
-            You are an AI assistant helping with social media addiction analysis. 
+            cache_key = GeminiAI.make_cache_key("follow_up", user_input, prediction_score, custom_question)
+            cached = GeminiAI.cache.get(cache_key)
+            if cached is not None:
+                return cached['text'], True
 
-            User's Profile Summary:
-            - Age: {user_input['Age']}, Gender: {user_input['Gender']}
-            - Daily Usage: {user_input['Avg_Daily_Usage_Hours']} hours
-            - Addiction Score: {prediction_score:.1f}/10 ({addiction_level} level)
-            - Most Used Platform: {user_input['Most_Used_Platform']}
-            - Academic Impact: {user_input['Affects_Academic_Performance']}
-            - Sleep: {user_input['Sleep_Hours_Per_Night']} hours
-            - Mental Health: {user_input['Mental_Health_Score']}/10
-
-            User's Question: {custom_question}
-
-            Please provide a helpful, personalized response based on their social media usage profile.
-            """
-            response = GeminiAI.client.models.generate_content(
+            response = GeminiAI.get_client().models.generate_content(
                 model="gemini-1.5-flash",
-                contents=[{"role": "user", "parts": [{"text": prompt_text}]}]
+                contents=[{"role": "user", "parts": [{"text": GeminiAI.build_follow_up_prompt(
+                    user_input, prediction_score, custom_question
+                )}]}]
             )
 
+            GeminiAI.cache.set(cache_key, {'text': response.text})
             return response.text, True
 
         except Exception as e:
             return f"Error: {str(e)}", False
 
+    @staticmethod
+    def prefetch_follow_ups(user_input, prediction_score, questions=None):
+        """Request several follow-up questions concurrently.
+
+        Returns a dict of question -> Future resolving to (response, success).
+        Questions already cached or in flight are not requested again.
+        """
+        futures = {}
+        for question in questions or GeminiAI.PRESET_FOLLOW_UPS.values():
+            cache_key = GeminiAI.make_cache_key("follow_up", user_input, prediction_score, question)
+            cached = GeminiAI.cache.get(cache_key)
+            if cached is not None:
+                future = Future()
+                future.set_result((cached['text'], True))
+            else:
+                with GeminiAI._in_flight_lock:
+                    future = GeminiAI._in_flight.get(cache_key)
+                    if future is None:
+                        future = GeminiAI._executor.submit(
+                            GeminiAI.create_follow_up_query, dict(user_input), prediction_score, question
+                        )
+                        GeminiAI._in_flight[cache_key] = future
+                        future.add_done_callback(lambda _, key=cache_key: GeminiAI._forget_in_flight(key))
+            futures[question] = future
+        return futures
+
+    @staticmethod
+    def _forget_in_flight(cache_key):
+        with GeminiAI._in_flight_lock:
+            GeminiAI._in_flight.pop(cache_key, None)
@@ -4,6 +4,7 @@ import warnings
 from config import Config
 from ui import UIComponents
 from modelHandler import ModelHandler
+from Gemini_integration import GeminiAI
 from userIO import UserInputHandler, ResultsDisplayHandler
 warnings.filterwarnings('ignore')
 
@@ -44,6 +45,9 @@ class SocialMediaApp:
                 st.session_state['prediction'] = prediction
                 st.session_state['user_input'] = user_input
 
+                if Config.GEMINI_API_KEY != "YOUR_GEMINI_API_KEY_HERE":
+                    GeminiAI.start_analysis(user_input, prediction)
+
                 st.markdown("---")
                 
                 col_results1, col_results2 = st.columns([2, 1])
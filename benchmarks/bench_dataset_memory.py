@@ -0,0 +1,58 @@
+"""In-memory footprint of the dataset: inferred dtypes vs. the DATASET_DTYPES schema.
+
+"before" is a plain pd.read_csv with inferred int64/float64/object columns
+(after dropping the repeated header lines), "after" is featureSchema.read_dataset.
+Also reports the encoded training frame from main.load_and_preprocess_data.
+
+    python benchmarks/bench_dataset_memory.py --csv Students_Social_Media_Addiction.csv
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from featureSchema import DATASET_DTYPES, NUMERIC_COLUMNS, TARGET_COLUMN, read_dataset
+
+def read_inferred(csv_path):
+    """The dataset as read before the schema existed"""
+    df = pd.read_csv(csv_path)
+    df = df[df['Age'] != 'Age'].reset_index(drop=True)
+    for column in NUMERIC_COLUMNS + [TARGET_COLUMN]:
+        df[column] = pd.to_numeric(df[column])
+    return df
+
+def timed(read, csv_path):
+    start = time.perf_counter()
+    df = read(csv_path)
+    return df, (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="Students_Social_Media_Addiction.csv")
+    args = parser.parse_args()
+
+    before, before_ms = timed(read_inferred, args.csv)
+    after, after_ms = timed(read_dataset, args.csv)
+    before_usage = before.memory_usage(deep=True, index=False)
+    after_usage = after.memory_usage(deep=True, index=False)
+
+    print(f"{'column':30} | {'before dtype':>12} | {'before KiB':>10} | {'after dtype':>12} | {'after KiB':>9}")
+    for column in before.columns:
+        after_dtype = str(after[column].dtype) if column in after else "dropped"
+        after_kib = after_usage.get(column, 0) / 1024
+        print(f"{column:30} | {str(before[column].dtype):>12} | {before_usage[column] / 1024:10.1f} | "
+              f"{after_dtype:>12} | {after_kib:9.1f}")
+    print(f"{'total':30} | {'':>12} | {before_usage.sum() / 1024:10.1f} | {'':>12} | {after_usage.sum() / 1024:9.1f}")
+    print(f"\nrows: {len(after)} | parse: {before_ms:.0f} ms inferred, {after_ms:.0f} ms with schema | "
+          f"{before_usage.sum() / after_usage.sum():.1f}x smaller | schema columns: {len(DATASET_DTYPES)}")
+
+    from main import load_and_preprocess_data
+    encoded, _ = load_and_preprocess_data(args.csv, use_cache=False)
+    print(f"encoded training frame: {encoded.memory_usage(deep=True, index=False).sum() / 1024:.1f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""sklearn predict vs. CompiledForest for the tree ensemble candidates.
+
+Fits each ensemble with the settings used in main.train_models, flattens it
+with CompiledForest.from_estimator and times both evaluators on 1, 100 and
+50k rows, checking that their predictions agree.
+
+    python benchmarks/bench_forest.py --rows 1 100 50000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+
+from bench_svr import load_matrix
+from compiledForest import CompiledForest
+
+def time_per_call(predict, X, min_seconds=0.5):
+    predict(X)
+    calls, start = 0, time.perf_counter()
+    while True:
+        predict(X)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed * 1000 / calls
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="Students_Social_Media_Addiction.csv")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 100, 50000])
+    args = parser.parse_args()
+
+    X, y = load_matrix(args.csv)
+    X_eval = np.resize(X, (max(args.rows), X.shape[1]))
+    candidates = (
+        ("Random Forest", RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)),
+        ("Gradient Boosting", GradientBoostingRegressor(n_estimators=100, random_state=42)),
+        ("Hist Gradient Boosting", HistGradientBoostingRegressor(max_iter=500, early_stopping=True, validation_fraction=0.1,
+                                                                 n_iter_no_change=10, tol=1e-3, random_state=42)),
+    )
+
+    print(f"{'model':22} | {'rows':>6} | {'sklearn ms':>10} | {'compiled ms':>11} | {'speedup':>7} | {'max |diff|':>10}")
+    for name, model in candidates:
+        model.fit(X, y)
+        compiled = CompiledForest.from_estimator(model)
+        for rows in args.rows:
+            batch = X_eval[:rows]
+            sklearn_ms = time_per_call(model.predict, batch)
+            if rows == 1:
+                compiled_ms = time_per_call(lambda row: compiled.predict_one(row[0]), batch)
+                diff = abs(compiled.predict_one(batch[0]) - model.predict(batch)[0])
+            else:
+                compiled_ms = time_per_call(compiled.predict, batch)
+                diff = np.abs(compiled.predict(batch) - model.predict(batch)).max()
+            print(f"{name:22} | {rows:6d} | {sklearn_ms:10.3f} | {compiled_ms:11.3f} | "
+                  f"{sklearn_ms / compiled_ms:6.1f}x | {diff:10.2e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Import-time report for the Streamlit app, with a lazy-import check.
+
+Runs `python -X importtime -c "import app"` in fresh interpreters and prints
+the slowest modules by cumulative import time. The median is reported next
+to a bare `import streamlit` measured the same way, so runs on different
+machines compare by the app's own overhead rather than by absolute wall
+time. Timing is informational; the script exits non-zero only when a
+dependency that should load on first use (Gemini client, PDF, charts,
+sklearn, ...) is imported eagerly, which tests/test_lazy_imports.py also
+checks.
+
+    python benchmarks/bench_importtime.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ['google.genai', 'fpdf', 'pycountry', 'sklearn', 'joblib', 'pandas']
+
+def import_times(module):
+    """{module: (self_us, cumulative_us)} for one cold import of `module`"""
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--baseline", default="streamlit",
+                        help="Module whose bare import time the app's is compared with")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(run[args.module][1] for run in runs) / 1000
+    baseline_ms = statistics.median(import_times(args.baseline)[args.baseline][1] for _ in range(args.runs)) / 1000
+    last = runs[-1]
+
+    print(f"{'module':48} | {'self ms':>8} | {'cumulative ms':>13}")
+    for name, (self_us, cumulative_us) in sorted(last.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{name:48} | {self_us / 1000:8.1f} | {cumulative_us / 1000:13.1f}")
+    print(f"\nimport {args.module}: median {median_ms:.1f} ms over {args.runs} runs | "
+          f"import {args.baseline}: {baseline_ms:.1f} ms | overhead {median_ms - baseline_ms:.1f} ms "
+          f"({median_ms / baseline_ms:.2f}x)")
+
+    eager = [name for name in LAZY_MODULES if name in last]
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+    sys.exit(1 if eager else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Inference benchmark for ModelHandler: load time, memory, single-row latency and batch throughput.
+
+For each model package (the joblib .pkl and, when present, the portable
+export) it measures, fully offline:
+
+- cold load time of ModelHandler.read_model_package and the RSS the loaded
+  package adds (including any modules unpickling imports), each in a fresh
+  interpreter (median of --load-runs);
+- ModelHandler.make_prediction latency on single user_input dicts (p50/p99);
+- ModelHandler.predict_batch throughput at each of --batch-sizes.
+
+Inputs are rows of the training CSV (synthesized from the package's category
+vocabularies when the CSV is absent). Results are printed and, with --output,
+written as JSON tagged with the current git commit so runs can be compared.
+
+    python benchmarks/bench_inference.py --output bench_inference.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+LOAD_SCRIPT = """
+import json, sys, time, warnings
+warnings.filterwarnings('ignore')
+from pipelineProfiler import _current_rss
+from modelHandler import ModelHandler
+rss_before = _current_rss()
+start = time.perf_counter()
+model_package = ModelHandler.read_model_package({path!r})
+elapsed_ms = (time.perf_counter() - start) * 1000
+rss_after = _current_rss()
+print(json.dumps({{'load_ms': elapsed_ms,
+                   'package_rss_mb': None if rss_before is None else (rss_after - rss_before) / 1048576}}))
+"""
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def cold_load(path, runs):
+    """Median load time and package memory over `runs` fresh interpreters"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", LOAD_SCRIPT.format(path=os.path.abspath(path))], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        samples.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    memory = [sample['package_rss_mb'] for sample in samples if sample['package_rss_mb'] is not None]
+    return {
+        'load_ms_median': statistics.median(sample['load_ms'] for sample in samples),
+        'load_ms_min': min(sample['load_ms'] for sample in samples),
+        'package_rss_mb': statistics.median(memory) if memory else None
+    }
+
+def input_records(csv_path, model_package, n_rows, seed=42):
+    """`n_rows` user_input dicts drawn from the CSV, or synthesized when it is not available"""
+    import pandas as pd
+    from featureSchema import CATEGORICAL_ENCODERS, FEATURE_COLUMNS, read_dataset
+    rng = np.random.default_rng(seed)
+    if os.path.exists(csv_path):
+        df = read_dataset(csv_path)[FEATURE_COLUMNS]
+        df = df.iloc[rng.integers(0, len(df), n_rows)].reset_index(drop=True)
+        for column in CATEGORICAL_ENCODERS:
+            df[column] = df[column].astype(str)
+        return df
+    lookups = model_package['category_lookups']
+    columns = {column: rng.choice(np.asarray(lookups[encoder_name]['classes'], dtype=object), n_rows)
+               for column, encoder_name in CATEGORICAL_ENCODERS.items()}
+    columns.update({
+        'Age': rng.integers(18, 25, n_rows),
+        'Avg_Daily_Usage_Hours': rng.uniform(1, 9, n_rows).round(1),
+        'Sleep_Hours_Per_Night': rng.uniform(4, 10, n_rows).round(1),
+        'Mental_Health_Score': rng.integers(4, 10, n_rows),
+        'Conflicts_Over_Social_Media': rng.integers(0, 6, n_rows)
+    })
+    return pd.DataFrame(columns)[FEATURE_COLUMNS]
+
+def single_row_latency(model_package, records, repeats):
+    from modelHandler import ModelHandler
+    rows = records.iloc[:min(repeats, len(records))].to_dict('records')
+    ModelHandler.make_prediction(model_package, rows[0])
+    timings_ms = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        ModelHandler.make_prediction(model_package, rows[i % len(rows)])
+        timings_ms.append((time.perf_counter() - start) * 1000)
+    return {
+        'repeats': repeats,
+        'p50_ms': float(np.percentile(timings_ms, 50)),
+        'p99_ms': float(np.percentile(timings_ms, 99)),
+        'mean_ms': float(np.mean(timings_ms))
+    }
+
+def batch_throughput(model_package, records, batch_sizes, min_seconds):
+    from modelHandler import ModelHandler
+    results = []
+    for rows in batch_sizes:
+        batch = records.iloc[:rows]
+        ModelHandler.predict_batch(model_package, batch)
+        calls, start = 0, time.perf_counter()
+        while True:
+            ModelHandler.predict_batch(model_package, batch)
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+        results.append({'rows': rows, 'ms_per_call': elapsed * 1000 / calls, 'rows_per_s': rows * calls / elapsed})
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", nargs="+", default=None,
+                        help="Model packages to benchmark (default: best_addiction_model.pkl and its export)")
+    parser.add_argument("--csv", default="Students_Social_Media_Addiction.csv")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=1000, help="make_prediction calls for the latency percentiles")
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="Minimum timed duration per batch size")
+    parser.add_argument("--load-runs", type=int, default=5)
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    import warnings
+    warnings.filterwarnings('ignore')
+    from config import Config
+    from modelHandler import ModelHandler
+
+    model_paths = args.model or [path for path in (Config.MODEL_FILE, Config.MODEL_DIR) if os.path.exists(path)]
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {'batch_sizes': args.batch_sizes, 'repeats': args.repeats, 'min_seconds': args.min_seconds,
+                     'load_runs': args.load_runs, 'csv': os.path.basename(args.csv)},
+        'packages': []
+    }
+    records = None
+    for path in model_paths:
+        model_package = ModelHandler.read_model_package(path)
+        if records is None:
+            records = input_records(args.csv, model_package, max(max(args.batch_sizes), args.repeats))
+        result = {
+            'path': path,
+            'model_name': model_package['model_name'],
+            'model_type': type(model_package['model']).__name__,
+            'compiled': model_package.get('compiled_model') is not None,
+            'load': cold_load(path, args.load_runs),
+            'single_row': single_row_latency(model_package, records, args.repeats),
+            'batch': batch_throughput(model_package, records, args.batch_sizes, args.min_seconds)
+        }
+        report['packages'].append(result)
+
+        load, single = result['load'], result['single_row']
+        print(f"\n{path} ({result['model_name']}, {result['model_type']}"
+              f"{', compiled' if result['compiled'] else ''})")
+        memory = "n/a" if load['package_rss_mb'] is None else f"{load['package_rss_mb']:.1f} MiB"
+        print(f"  load: {load['load_ms_median']:.1f} ms median ({load['load_ms_min']:.1f} min) | memory: {memory}")
+        print(f"  make_prediction: p50 {single['p50_ms']:.3f} ms | p99 {single['p99_ms']:.3f} ms")
+        print(f"  {'batch rows':>10} | {'ms/call':>10} | {'rows/s':>12}")
+        for batch in result['batch']:
+            print(f"  {batch['rows']:10d} | {batch['ms_per_call']:10.3f} | {batch['rows_per_s']:12.0f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to '{args.output}'")
+
+if __name__ == "__main__":
+    main()
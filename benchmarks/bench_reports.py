@@ -0,0 +1,157 @@
+"""Micro-benchmark for PDF report rendering.
+
+Compares the original per-report path (fresh FPDF, add_font re-reading the
+DejaVu metrics, full TTF subset build on output) with the ReportTemplate path
+used by PDFGenerator.render_report. Each report is a different row of the
+training CSV, with either the bulk-export template text or a synthetic
+free-form analysis standing in for per-user Gemini text, so the template
+path pays for a subset build whenever a report uses a new character set.
+Reports mean time and peak traced memory per report, and the font subset
+cache hit rate of the template path (it starts empty).
+
+    python benchmarks/bench_reports.py --reports 200 --ai-text varied
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from fpdf import FPDF
+from reportGenerator import PDFGenerator
+from reportTemplate import ReportTemplate, SubsetCachingTTFontFile
+
+SAMPLE_INPUT = {
+    'Age': 19, 'Gender': 'Female', 'Academic_Level': 'Undergraduate', 'Country': 'Bangladesh',
+    'Avg_Daily_Usage_Hours': 5.2, 'Most_Used_Platform': 'Instagram', 'Affects_Academic_Performance': 'Yes',
+    'Sleep_Hours_Per_Night': 6.5, 'Mental_Health_Score': 6, 'Conflicts_Over_Social_Media': 3
+}
+SAMPLE_RESPONSE = "\n".join(
+    f"{i}. Try to keep daily usage under three hours and avoid screens an hour before bed." for i in range(1, 25)
+)
+
+# Sentences the synthetic free-form analysis is assembled from, in the register of Gemini's answers
+ANALYSIS_SENTENCES = [
+    "**Overview:** at {hours} hours a day, {platform} takes up about {share}% of your waking time.",
+    "Sleeping {sleep} hours is {sleep_note} the 7–9 hours most adults need.",
+    "Your mental health score of {mental}/10 suggests {mental_note}.",
+    "* Turn off non-essential {platform} notifications → fewer urges to check your phone.",
+    "* Try a \"no screens after 10 PM\" rule; it’s one of the quickest wins for sleep.",
+    "# Practical steps for a {level} score ({score}/10)",
+    "Students in {country} report similar patterns — you’re not alone.",
+    "1) Track your screen time for a week (Settings → Screen Time / Digital Wellbeing).",
+    "2) Replace 30 minutes of scrolling with a walk, reading or exercise.",
+    "3) Set app limits of ≤ {limit} hours/day and review them every Sunday.",
+    "Conflicts over social media ({conflicts} recently) often ease when usage drops by 20–30%.",
+    "As a {age}-year-old {academic} student, protecting study time matters: use “focus mode” during lectures.",
+    "Q: Will quitting cold turkey help? A: Usually not — gradual reduction sticks better.",
+    "Remember: progress > perfection. Small, consistent changes add up!",
+    "If you feel overwhelmed, talk to a counselor or someone you trust (your campus may offer free sessions).",
+    "Note — these suggestions are general guidance, not a medical diagnosis.",
+]
+
+def varied_analysis(user_input, prediction_score, rng):
+    """Synthetic free-form analysis text that differs from report to report like per-user Gemini output"""
+    from AnalyzeAddiction import AddictionAnalyzer
+    level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
+    values = {
+        'hours': user_input['Avg_Daily_Usage_Hours'], 'sleep': user_input['Sleep_Hours_Per_Night'],
+        'platform': user_input['Most_Used_Platform'], 'country': user_input['Country'],
+        'academic': user_input['Academic_Level'].lower(), 'age': user_input['Age'],
+        'mental': user_input['Mental_Health_Score'], 'conflicts': user_input['Conflicts_Over_Social_Media'],
+        'share': round(user_input['Avg_Daily_Usage_Hours'] / 16 * 100), 'level': level,
+        'score': f"{prediction_score:.1f}", 'limit': max(1, round(user_input['Avg_Daily_Usage_Hours'] / 2)),
+        'sleep_note': "within" if user_input['Sleep_Hours_Per_Night'] >= 7 else "below",
+        'mental_note': "room for support" if user_input['Mental_Health_Score'] < 6 else "a solid baseline"
+    }
+    chosen = rng.choice(len(ANALYSIS_SENTENCES), size=rng.integers(6, 13), replace=False)
+    return "\n".join(ANALYSIS_SENTENCES[i].format(**values) for i in sorted(chosen))
+
+def report_cases(csv_path, reports, ai_text, seed=42):
+    """(user_input, score, level, ai_response) for `reports` CSV rows, or the single sample when the CSV is absent"""
+    if not os.path.exists(csv_path):
+        print(f"'{csv_path}' not found; rendering the same sample report {reports} times")
+        return [(SAMPLE_INPUT, 7.6, "High", SAMPLE_RESPONSE)] * reports
+    from AnalyzeAddiction import AddictionAnalyzer
+    from bulkReports import template_analysis
+    from featureSchema import TARGET_COLUMN, feature_records, read_dataset
+    rng = np.random.default_rng(seed)
+    df = read_dataset(csv_path)
+    df = df.iloc[rng.choice(len(df), size=min(reports, len(df)), replace=False)]
+    cases = []
+    for user_input, score in zip(feature_records(df), df[TARGET_COLUMN].astype(float)):
+        level, _, _ = AddictionAnalyzer.get_addiction_level(score)
+        text = template_analysis(user_input, score) if ai_text == "template" else varied_analysis(user_input, score, rng)
+        cases.append((user_input, score, level, text))
+    return cases
+
+def render_uncached(user_input, prediction_score, addiction_level, ai_response):
+    """The report layout as it was rendered before ReportTemplate existed"""
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_font("DejaVu", "", ReportTemplate.FONT_PATH, uni=True)
+    pdf.fonts['dejavu']['ttffile'] = ReportTemplate.FONT_PATH
+    pdf.set_font("DejaVu", "", 16)
+    pdf.cell(0, 10, ReportTemplate.TITLE, ln=True, align='C')
+    pdf.set_font("DejaVu", "", 12)
+    pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
+    pdf.ln(10)
+    for title, lines in (
+        ("User Profile", [f"{k.replace('_', ' ')}: {v}" for k, v in user_input.items()]),
+        ("Prediction Results", [f"Addiction Score: {prediction_score:.1f}/10", f"Addiction Level: {addiction_level}"]),
+    ):
+        pdf.set_font("DejaVu", "", 14)
+        pdf.cell(0, 10, title, ln=True)
+        pdf.set_font("DejaVu", "", 12)
+        for line in lines:
+            pdf.cell(0, 8, line, ln=True)
+        pdf.ln(5)
+    pdf.set_font("DejaVu", "", 14)
+    pdf.cell(0, 10, "AI Personalized Analysis", ln=True)
+    pdf.set_font("DejaVu", "", 12)
+    for line in ai_response.split("\n"):
+        pdf.multi_cell(0, 8, line)
+    return pdf.output(dest='S').encode("latin1")
+
+def measure(render, cases):
+    """Mean ms, peak KiB and mean bytes per report, and the subset cache hit rate (None when it was not used)"""
+    render(*cases[0])
+    SubsetCachingTTFontFile.clear()
+    total_bytes = 0
+    start = time.perf_counter()
+    for case in cases:
+        total_bytes += len(render(*case))
+    per_report_ms = (time.perf_counter() - start) * 1000 / len(cases)
+    lookups = SubsetCachingTTFontFile.hits + SubsetCachingTTFontFile.misses
+    hit_rate = SubsetCachingTTFontFile.hits / lookups if lookups else None
+
+    tracemalloc.start()
+    render(*cases[-1])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_report_ms, peak / 1024, total_bytes / len(cases), hit_rate
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=200)
+    parser.add_argument("--csv", default=os.path.join(ROOT, "Students_Social_Media_Addiction.csv"))
+    parser.add_argument("--ai-text", choices=["template", "varied"], default="varied",
+                        help="Bulk-export template text, or synthetic free-form text like per-user Gemini output")
+    args = parser.parse_args()
+
+    cases = report_cases(args.csv, args.reports, args.ai_text)
+    print(f"{len(cases)} reports, {args.ai_text} analysis text")
+    print(f"{'path':12} | {'ms/report':>10} | {'peak KiB':>10} | {'PDF bytes':>10} | {'subset hits':>11}")
+    for name, render in (("before", render_uncached), ("template", PDFGenerator.render_report)):
+        per_report_ms, peak_kib, size, hit_rate = measure(render, cases)
+        hits = "-" if hit_rate is None else f"{hit_rate:.0%}"
+        print(f"{name:12} | {per_report_ms:10.2f} | {peak_kib:10.1f} | {size:10.0f} | {hits:>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Successive-halving search vs. an exhaustive grid over the same SEARCH_SPACES entry.
+
+Both searches use the same 3-fold CV on the same training rows; reports wall
+time, number of fits and the best CV R² each finds.
+
+    python benchmarks/bench_search.py --csv Students_Social_Media_Addiction.csv --model "Hist Gradient Boosting"
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.model_selection import GridSearchCV, KFold, ParameterGrid
+from sklearn.preprocessing import StandardScaler
+
+from hyperSearch import SEARCH_SPACES, HyperparameterSearch
+from main import SCALED_MODELS, candidate_models, load_and_preprocess_data
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="Students_Social_Media_Addiction.csv")
+    parser.add_argument("--model", default="Hist Gradient Boosting", choices=sorted(SEARCH_SPACES))
+    parser.add_argument("--rows", type=int, default=10000, help="Training rows to search on")
+    parser.add_argument("--candidates", type=int, default=30)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    args = parser.parse_args()
+
+    df, _ = load_and_preprocess_data(args.csv)
+    df = df.sample(n=min(args.rows, len(df)), random_state=42)
+    X, y = df.drop('Addicted_Score', axis=1).to_numpy(dtype=float), df['Addicted_Score'].to_numpy(dtype=float)
+    if args.model in SCALED_MODELS:
+        X = StandardScaler().fit_transform(X)
+
+    estimator = candidate_models(X.shape[1])[args.model]
+
+    search = HyperparameterSearch(n_candidates=args.candidates, n_jobs=args.n_jobs)
+    _, halving = search.run(args.model, estimator, X, y)
+
+    grid = GridSearchCV(estimator, SEARCH_SPACES[args.model], scoring='r2', refit=False, n_jobs=args.n_jobs,
+                        cv=KFold(n_splits=search.cv, shuffle=True, random_state=search.random_state))
+    start = time.perf_counter()
+    grid.fit(X, y)
+    grid_time = time.perf_counter() - start
+    grid_trials = len(ParameterGrid(SEARCH_SPACES[args.model]))
+
+    print(f"\n{args.model} on {len(X)} rows, {search.cv}-fold CV")
+    print(f"{'search':10} | {'trials':>6} | {'time s':>8} | {'best CV R2':>10} | best params")
+    print(f"{'halving':10} | {halving['Search_Trials']:6d} | {halving['Search_Time']:8.1f} | "
+          f"{halving['Search_CV_R2']:10.4f} | {halving['Best_Params']}")
+    print(f"{'grid':10} | {grid_trials:6d} | {grid_time:8.1f} | {grid.best_score_:10.4f} | {grid.best_params_}")
+    print(f"\nhalving search took {halving['Search_Time'] / grid_time:.0%} of the grid's time")
+
+if __name__ == "__main__":
+    main()
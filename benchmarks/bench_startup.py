@@ -0,0 +1,58 @@
+"""Cold-start time of the joblib model package vs. the portable export.
+
+Exports the joblib package to a temporary portable directory, then loads
+each format in fresh interpreters and reports the median wall time of the
+imports plus the load, and whether scikit-learn ended up imported.
+
+    python benchmarks/bench_startup.py --model best_addiction_model.pkl --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOADERS = {
+    'joblib': "import joblib\nmodel_package = joblib.load({path!r})",
+    'portable': "from portableModel import PortableModel\nmodel_package = PortableModel.load({path!r})",
+    'ModelHandler (pkl)': "from modelHandler import ModelHandler\nmodel_package = ModelHandler.read_model_package({path!r})",
+    'ModelHandler (export)': "from modelHandler import ModelHandler\nmodel_package = ModelHandler.read_model_package({path!r})",
+}
+
+def cold_start_ms(code):
+    script = (
+        "import sys, time, warnings\n"
+        "warnings.filterwarnings('ignore')\n"
+        "start = time.perf_counter()\n"
+        f"{code}\n"
+        "print((time.perf_counter() - start) * 1000, 'sklearn' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    elapsed_ms, sklearn_loaded = output.stdout.split()
+    return float(elapsed_ms), sklearn_loaded == "True"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="best_addiction_model.pkl")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    model_file = os.path.abspath(args.model)
+    with tempfile.TemporaryDirectory() as tmp:
+        export_dir = os.path.join(tmp, "export")
+        subprocess.run([sys.executable, "portableModel.py", model_file, export_dir], cwd=ROOT, check=True,
+                       capture_output=True)
+        paths = {'joblib': model_file, 'portable': export_dir,
+                 'ModelHandler (pkl)': model_file, 'ModelHandler (export)': export_dir}
+
+        print(f"{'loader':22} | {'median ms':>10} | {'min ms':>8} | sklearn imported")
+        for name, code in LOADERS.items():
+            runs = [cold_start_ms(code.format(path=paths[name])) for _ in range(args.runs)]
+            times = [elapsed for elapsed, _ in runs]
+            print(f"{name:22} | {statistics.median(times):10.1f} | {min(times):8.1f} | {runs[-1][1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Exact SVR vs. the Nystroem-approximated SVR candidate from main.approximate_svr.
+
+Trains both on standardized subsamples of increasing size and reports fit
+time, single-row and batch predict latency, and R² on a fixed holdout set.
+
+    python benchmarks/bench_svr.py --sizes 1000 5000 10000 20000 40000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVR
+
+from featureSchema import CATEGORICAL_ENCODERS, FEATURE_COLUMNS, TARGET_COLUMN, read_dataset
+from main import approximate_svr
+
+def load_matrix(csv_path):
+    df = read_dataset(csv_path)
+    for column in CATEGORICAL_ENCODERS:
+        df[column] = df[column].astype('category').cat.codes
+    return df[FEATURE_COLUMNS].to_numpy(dtype=float), df[TARGET_COLUMN].to_numpy(dtype=float)
+
+def measure(model, X_fit, y_fit, X_test, y_test, single_row_repeats=200):
+    start = time.perf_counter()
+    model.fit(X_fit, y_fit)
+    fit_time = time.perf_counter() - start
+
+    row = X_test[:1]
+    start = time.perf_counter()
+    for _ in range(single_row_repeats):
+        model.predict(row)
+    single_ms = (time.perf_counter() - start) * 1000 / single_row_repeats
+
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    batch_us = (time.perf_counter() - start) * 1e6 / len(X_test)
+    return fit_time, single_ms, batch_us, r2_score(y_test, y_pred)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="Students_Social_Media_Addiction.csv")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 5000, 10000, 20000])
+    parser.add_argument("--components", type=int, default=500)
+    args = parser.parse_args()
+
+    X, y = load_matrix(args.csv)
+    X_pool, X_test, y_pool, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    scaler = StandardScaler().fit(X_pool)
+    X_pool, X_test = scaler.transform(X_pool), scaler.transform(X_test)
+    rng = np.random.RandomState(42)
+
+    print(f"{'rows':>7} | {'model':16} | {'fit s':>8} | {'1-row ms':>9} | {'batch us/row':>12} | {'R²':>7}")
+    for size in args.sizes:
+        idx = rng.choice(len(X_pool), size=min(size, len(X_pool)), replace=False)
+        candidates = (
+            ("SVR (exact)", SVR(kernel='rbf', C=1.0, gamma='scale')),
+            ("SVR (Nystroem)", approximate_svr(X.shape[1], args.components)),
+        )
+        for name, model in candidates:
+            fit_time, single_ms, batch_us, r2 = measure(model, X_pool[idx], y_pool[idx], X_test, y_test)
+            print(f"{len(idx):7d} | {name:16} | {fit_time:8.2f} | {single_ms:9.3f} | {batch_us:12.2f} | {r2:7.4f}")
+
+if __name__ == "__main__":
+    main()
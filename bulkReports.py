@@ -0,0 +1,138 @@
+import argparse
+import csv
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from featureSchema import feature_records, read_dataset
+from modelHandler import ModelHandler
+from AnalyzeAddiction import AddictionAnalyzer
+from reportGenerator import PDFGenerator
+
+def template_analysis(user_input, prediction_score):
+    """Rule-based analysis text used when no cached AI response is available"""
+    addiction_level, _, _ = AddictionAnalyzer.get_addiction_level(prediction_score)
+    lines = [f"Your predicted addiction score is {prediction_score:.1f}/10 ({addiction_level} level)."]
+    if prediction_score <= 3:
+        lines.append("Your social media usage appears to be well-controlled. You maintain a healthy balance between online and offline activities.")
+    elif prediction_score <= 6:
+        lines.append("Your social media usage is moderate. Consider monitoring your habits to prevent them from becoming problematic.")
+    else:
+        lines.append("Your social media usage patterns suggest potential addiction. Consider seeking support or implementing digital wellness strategies.")
+    if user_input['Avg_Daily_Usage_Hours'] > 6:
+        lines.append("- Consider setting daily time limits to reduce screen time.")
+    if user_input['Sleep_Hours_Per_Night'] < 6:
+        lines.append("- Try to get 7-8 hours of sleep for better health.")
+    if user_input['Mental_Health_Score'] < 5:
+        lines.append("- Consider professional support for mental wellness.")
+    return "\n".join(lines)
+
+def cached_analysis(user_input, prediction_score):
+    """Return the cached Gemini analysis for this profile, or None"""
+    from Gemini_integration import GeminiAI
+    cached = GeminiAI.cache.get(GeminiAI.make_cache_key("analysis", user_input, prediction_score))
+    return cached['text'] if cached is not None else None
+
+def render_chunk(jobs):
+    """Render a chunk of (file_name, user_input, score, level, ai_text) jobs in a worker process"""
+    return [
+        (file_name, PDFGenerator.render_report(user_input, score, level, ai_text))
+        for file_name, user_input, score, level, ai_text in jobs
+    ]
+
+class ReportSink:
+    """Writes rendered reports and the manifest into a directory or a .zip file"""
+
+    def __init__(self, output_path):
+        self.is_zip = output_path.lower().endswith(".zip")
+        self.output_path = output_path
+        if self.is_zip:
+            directory = os.path.dirname(output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.archive = zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_STORED)
+        else:
+            os.makedirs(output_path, exist_ok=True)
+
+    def write(self, file_name, data):
+        if self.is_zip:
+            self.archive.writestr(file_name, data)
+        else:
+            with open(os.path.join(self.output_path, file_name), "wb") as f:
+                f.write(data)
+
+    def close(self):
+        if self.is_zip:
+            self.archive.close()
+
+def export_reports(csv_path, output_path, workers=None, ai_text="template", chunk_size=64,
+                   model_file=None):
+    """Score every student in `csv_path` and render one PDF report per row"""
+    start = time.perf_counter()
+    model_package = ModelHandler.read_model_package(model_file)
+    df = read_dataset(csv_path)
+    scores = ModelHandler.predict_batch(model_package, df)
+    scored_at = time.perf_counter()
+
+    jobs = []
+    manifest_rows = []
+    for row_number, (user_input, score) in enumerate(zip(feature_records(df), scores)):
+        score = float(score)
+        level, _, _ = AddictionAnalyzer.get_addiction_level(score)
+        if ai_text == "none":
+            text, text_source = "", "none"
+        else:
+            text = cached_analysis(user_input, score) if ai_text == "cache" else None
+            text_source = "cache"
+            if text is None:
+                text, text_source = template_analysis(user_input, score), "template"
+        file_name = f"report_{row_number:06d}.pdf"
+        jobs.append((file_name, user_input, score, level, text))
+        manifest_rows.append({'row': row_number, 'file': file_name, 'prediction': round(score, 4),
+                              'addiction_level': level, 'analysis_source': text_source})
+
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    sink = ReportSink(output_path)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rendered in executor.map(render_chunk, chunks):
+                for file_name, data in rendered:
+                    sink.write(file_name, data)
+
+        manifest = io.StringIO()
+        writer = csv.DictWriter(manifest, fieldnames=['row', 'file', 'prediction', 'addiction_level', 'analysis_source'])
+        writer.writeheader()
+        writer.writerows(manifest_rows)
+        sink.write("manifest.csv", manifest.getvalue().encode("utf-8"))
+    finally:
+        sink.close()
+
+    finished_at = time.perf_counter()
+    return {
+        'reports': len(jobs),
+        'scoring_seconds': scored_at - start,
+        'rendering_seconds': finished_at - scored_at,
+        'total_seconds': finished_at - start
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a PDF report for every student in a cohort CSV")
+    parser.add_argument("csv_path", help="CSV in the Students_Social_Media_Addiction.csv schema")
+    parser.add_argument("output", help="Output directory, or a path ending in .zip")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--ai-text", choices=["template", "cache", "none"], default="template",
+                        help="Analysis text: rule-based template, cached Gemini responses with template fallback, or none")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Reports rendered per worker task")
+    parser.add_argument("--model", default=None,
+                        help="Model package or portable export directory (default: the export when present)")
+    args = parser.parse_args()
+
+    stats = export_reports(args.csv_path, args.output, args.workers, args.ai_text, args.chunk_size, args.model)
+    print(f"Rendered {stats['reports']} reports into '{args.output}' in {stats['total_seconds']:.1f}s "
+          f"(scoring {stats['scoring_seconds']:.2f}s, rendering {stats['rendering_seconds']:.1f}s, "
+          f"{stats['reports'] / max(stats['rendering_seconds'], 1e-9):.0f} reports/s)")
+
+if __name__ == "__main__":
+    main()
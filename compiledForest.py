@@ -0,0 +1,144 @@
+import numpy as np
+
+class CompiledForest:
+    """Tree ensemble flattened into contiguous NumPy node arrays.
+
+    Every node of every tree lives in the same `feature`, `threshold`, `left`,
+    `right` and `value` arrays; `roots` holds the first node of each tree.
+    A row goes left when x[feature] <= threshold, and leaves point to themselves
+    (threshold +inf) so every tree can be walked in lockstep for `max_depth`
+    steps with no per-node branching.
+    Predictions are `offset + scale * sum(leaf values)`, which covers random
+    forests (mean of trees) and gradient boosting (init + learning_rate * sum).
+    """
+
+    SUPPORTED_MODELS = ['RandomForestRegressor', 'GradientBoostingRegressor', 'HistGradientBoostingRegressor']
+
+    def __init__(self, feature, threshold, left, right, value, roots, offset, scale, max_depth,
+                 input_dtype=np.float32):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.offset = float(offset)
+        self.scale = float(scale)
+        self.max_depth = int(max_depth)
+        self.input_dtype = np.dtype(input_dtype)
+        self._children = np.stack([left, right], axis=1).ravel()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_children']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._children = np.stack([self.left, self.right], axis=1).ravel()
+
+    @staticmethod
+    def supports(model):
+        return type(model).__name__ in CompiledForest.SUPPORTED_MODELS
+
+    @classmethod
+    def from_estimator(cls, model):
+        """Flatten a fitted RandomForest, GradientBoosting or HistGradientBoosting regressor"""
+        model_type = type(model).__name__
+        if model_type == 'RandomForestRegressor':
+            trees = [_sklearn_tree_nodes(tree.tree_) for tree in model.estimators_]
+            offset, scale, input_dtype = 0.0, 1.0 / len(trees), np.float32
+        elif model_type == 'GradientBoostingRegressor':
+            if model.init_ == 'zero':
+                offset = 0.0
+            elif hasattr(model.init_, 'constant_'):
+                offset = float(np.ravel(model.init_.constant_)[0])
+            else:
+                raise ValueError("Only constant or 'zero' init estimators can be compiled")
+            trees = [_sklearn_tree_nodes(tree.tree_) for tree in model.estimators_[:, 0]]
+            scale, input_dtype = model.learning_rate, np.float32
+        elif model_type == 'HistGradientBoostingRegressor':
+            if model._loss.link.__class__.__name__ != 'IdentityLink':
+                raise ValueError("Only identity-link losses can be compiled")
+            trees = [_hist_predictor_nodes(predictors[0]) for predictors in model._predictors]
+            offset, scale, input_dtype = float(np.ravel(model._baseline_prediction)[0]), 1.0, np.float64
+        else:
+            raise ValueError(f"Cannot compile a {model_type}, expected one of {cls.SUPPORTED_MODELS}")
+
+        starts, parts, start = [], [], 0
+        for feature, threshold, left, right, value in trees:
+            own = np.arange(start, start + len(feature))
+            parts.append((feature, threshold,
+                          np.where(left < 0, own, left + start),
+                          np.where(right < 0, own, right + start),
+                          value))
+            starts.append(start)
+            start += len(feature)
+        feature, threshold, left, right, value = (np.concatenate(column) for column in zip(*parts))
+        is_leaf = left == np.arange(len(left))
+        return cls(
+            feature=np.where(is_leaf, 0, feature).astype(np.intp),
+            threshold=np.where(is_leaf, np.inf, threshold).astype(np.float64),
+            left=left.astype(np.intp),
+            right=right.astype(np.intp),
+            value=value.astype(np.float64),
+            roots=np.array(starts, dtype=np.intp),
+            offset=offset,
+            scale=scale,
+            max_depth=max(_depth(nodes[2], nodes[3]) for nodes in trees),
+            input_dtype=input_dtype
+        )
+
+    def predict_one(self, x):
+        """Score a single feature vector, walking all trees at once"""
+        x = np.asarray(x, dtype=self.input_dtype).ravel()
+        nodes = self.roots
+        for _ in range(self.max_depth):
+            nodes = self._children[2 * nodes + (x[self.feature[nodes]] > self.threshold[nodes])]
+        return self.offset + self.scale * self.value[nodes].sum()
+
+    def predict(self, X, chunk_rows=256):
+        """Score a matrix of rows, walking every (row, tree) pair in lockstep per chunk"""
+        X = np.asarray(X, dtype=self.input_dtype)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        predictions = np.empty(len(X))
+        for start in range(0, len(X), chunk_rows):
+            chunk = np.ascontiguousarray(X[start:start + chunk_rows])
+            n_rows, n_features = chunk.shape
+            flat_X = chunk.ravel()
+            row_offsets = (np.arange(n_rows, dtype=np.intp) * n_features)[:, None]
+            nodes = np.broadcast_to(self.roots, (n_rows, len(self.roots)))
+            for _ in range(self.max_depth):
+                go_right = flat_X[row_offsets + self.feature[nodes]] > self.threshold[nodes]
+                nodes = self._children[2 * nodes + go_right]
+            predictions[start:start + n_rows] = self.offset + self.scale * self.value[nodes].sum(axis=1)
+        return predictions
+
+def _sklearn_tree_nodes(tree):
+    """(feature, threshold, left, right, value) of a fitted sklearn Tree, -1 children for leaves"""
+    return (tree.feature, tree.threshold, tree.children_left, tree.children_right, tree.value[:, 0, 0])
+
+def _hist_predictor_nodes(predictor):
+    """(feature, threshold, left, right, value) of a HistGradientBoosting TreePredictor"""
+    nodes = predictor.nodes
+    if (nodes['is_categorical'] != 0).any():
+        raise ValueError("Categorical splits cannot be compiled")
+    leaf = nodes['is_leaf'].astype(bool)
+    return (
+        nodes['feature_idx'].astype(np.int64),
+        nodes['num_threshold'],
+        np.where(leaf, -1, nodes['left'].astype(np.int64)),
+        np.where(leaf, -1, nodes['right'].astype(np.int64)),
+        nodes['value']
+    )
+
+def _depth(left, right):
+    """Depth of the deepest leaf of one tree given its local child arrays"""
+    depth, frontier = 0, np.array([0])
+    while True:
+        frontier = frontier[left[frontier] >= 0]
+        if not frontier.size:
+            return depth
+        frontier = np.concatenate([left[frontier], right[frontier]])
+        depth += 1
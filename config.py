@@ -6,6 +6,24 @@ load_dotenv()
 class Config:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     MODEL_FILE = 'best_addiction_model.pkl'
+    MODEL_DIR = os.getenv("MODEL_DIR", "best_addiction_model")
+    DATASET_CACHE_DIR = os.getenv("DATASET_CACHE_DIR", ".dataset_cache")
+    CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", ".training_checkpoints")
+    RUN_REPORT_FILE = os.getenv("RUN_REPORT_FILE", "best_addiction_model_run_report.json")
+    SCORING_HOST = os.getenv("SCORING_HOST", "127.0.0.1")
+    SCORING_PORT = int(os.getenv("SCORING_PORT", "8080"))
+    SCORING_WORKERS = int(os.getenv("SCORING_WORKERS", "16"))
+    GEMINI_CACHE_SIZE = int(os.getenv("GEMINI_CACHE_SIZE", "256"))
+    GEMINI_CACHE_TTL = int(os.getenv("GEMINI_CACHE_TTL", "86400"))
+    GEMINI_CACHE_FILE = os.getenv("GEMINI_CACHE_FILE")
+    GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+    GEMINI_PREFETCH_FOLLOW_UPS = os.getenv("GEMINI_PREFETCH_FOLLOW_UPS", "false").lower() == "true"
+    REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", "2"))
+    REPORT_JOB_HISTORY = int(os.getenv("REPORT_JOB_HISTORY", "256"))
+    REPORT_STORE_SIZE = int(os.getenv("REPORT_STORE_SIZE", "128"))
+    REPORT_DIR = os.getenv("REPORT_DIR")
+    REPORT_DIR_MAX_BYTES = int(os.getenv("REPORT_DIR_MAX_BYTES", str(200 * 1024 * 1024)))
+    REPORT_MAX_AGE = int(os.getenv("REPORT_MAX_AGE", str(7 * 24 * 3600)))
     PAGE_CONFIG = {
         "page_title": "Social Media Addiction Predictor",
         "page_icon": "📱",
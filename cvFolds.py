@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import KFold
+from sklearn.preprocessing import StandardScaler
+
+class CrossValidationFolds:
+    """Holdout and K-fold training matrices built once and shared by every candidate model.
+
+    Each fold gets its own StandardScaler fit on that fold's training rows
+    only, so scaled models are validated without leaking the validation rows'
+    statistics into the scaling. The raw and scaled matrices for the holdout
+    fit and for every fold are materialized as contiguous float arrays; with
+    `shared=True` they are written to a temporary directory and reopened as
+    read-only memory maps, which joblib hands to worker processes by file
+    reference instead of pickling a copy per task. Use it as a context manager
+    (or call `close`) to remove the files.
+    """
+
+    def __init__(self, X_train, X_test, y_train, n_splits=5, shared=True):
+        self.feature_names = list(X_train.columns) if hasattr(X_train, 'columns') else None
+        X_train = np.ascontiguousarray(X_train, dtype=float)
+        X_test = np.ascontiguousarray(X_test, dtype=float)
+        y_train = np.ascontiguousarray(y_train, dtype=float)
+        self.n_splits = n_splits
+        self.indices = list(KFold(n_splits=n_splits).split(X_train))
+        self.scaler = StandardScaler().fit(X_train)
+        self._directory = tempfile.mkdtemp(prefix="cv_folds_") if shared else None
+
+        self._arrays = {}
+        self._store('holdout_X_fit', X_train)
+        self._store('holdout_X_eval', X_test)
+        self._store('holdout_X_fit_scaled', self.scaler.transform(X_train))
+        self._store('holdout_X_eval_scaled', self.scaler.transform(X_test))
+        self._store('holdout_y_fit', y_train)
+        for fold, (fit_idx, val_idx) in enumerate(self.indices):
+            fold_scaler = StandardScaler().fit(X_train[fit_idx])
+            self._store(f'fold{fold}_X_fit', X_train[fit_idx])
+            self._store(f'fold{fold}_X_eval', X_train[val_idx])
+            self._store(f'fold{fold}_X_fit_scaled', fold_scaler.transform(X_train[fit_idx]))
+            self._store(f'fold{fold}_X_eval_scaled', fold_scaler.transform(X_train[val_idx]))
+            self._store(f'fold{fold}_y_fit', y_train[fit_idx])
+            self._store(f'fold{fold}_y_eval', y_train[val_idx])
+
+    def _store(self, name, array):
+        array = np.ascontiguousarray(array, dtype=float)
+        if self._directory is not None:
+            path = os.path.join(self._directory, f"{name}.npy")
+            np.save(path, array)
+            array = np.load(path, mmap_mode='r')
+        self._arrays[name] = array
+
+    def holdout(self, scaled):
+        """(X_fit, y_fit, X_eval) for the final fit on the whole training split"""
+        suffix = '_scaled' if scaled else ''
+        return (self._arrays[f'holdout_X_fit{suffix}'], self._arrays['holdout_y_fit'],
+                self._arrays[f'holdout_X_eval{suffix}'])
+
+    def fold(self, fold, scaled):
+        """(X_fit, y_fit, X_eval) for one CV fold"""
+        suffix = '_scaled' if scaled else ''
+        return (self._arrays[f'fold{fold}_X_fit{suffix}'], self._arrays[f'fold{fold}_y_fit'],
+                self._arrays[f'fold{fold}_X_eval{suffix}'])
+
+    def fold_metrics(self, fold, y_pred):
+        """R², RMSE and MAE of one fold's validation predictions"""
+        y_true = self._arrays[f'fold{fold}_y_eval']
+        return {
+            'R2': r2_score(y_true, y_pred),
+            'RMSE': float(np.sqrt(mean_squared_error(y_true, y_pred))),
+            'MAE': mean_absolute_error(y_true, y_pred)
+        }
+
+    def close(self):
+        if self._directory is not None:
+            self._arrays = {}
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
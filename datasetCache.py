@@ -0,0 +1,88 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+class DatasetCache:
+    """Encoded training data cached as one .npy array per column, keyed by the CSV's content hash.
+
+    An entry lives in `<cache_dir>/<csv name>-<hash prefix>/` with a manifest
+    holding the full SHA-256 of the source file, the column dtypes and the
+    encoder vocabularies. A changed CSV hashes differently and misses the
+    cache; saving a new entry removes the stale ones for the same file.
+    """
+
+    FORMAT_VERSION = 2
+    MANIFEST = "manifest.json"
+
+    def __init__(self, csv_path, cache_dir=".dataset_cache"):
+        self.csv_path = csv_path
+        self.cache_dir = cache_dir
+        self._content_hash = None
+
+    @property
+    def content_hash(self):
+        if self._content_hash is None:
+            digest = hashlib.sha256()
+            with open(self.csv_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    @property
+    def entry_dir(self):
+        return os.path.join(self.cache_dir, f"{os.path.basename(self.csv_path)}-{self.content_hash[:16]}")
+
+    def load(self, mmap=True):
+        """Return (df_processed, encoders) from the cache, or None when the CSV has no valid entry"""
+        manifest_path = os.path.join(self.entry_dir, DatasetCache.MANIFEST)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if manifest.get('format_version') != DatasetCache.FORMAT_VERSION or manifest.get('source_sha256') != self.content_hash:
+            return None
+
+        import pandas as pd
+        from sklearn.preprocessing import LabelEncoder
+        df = pd.DataFrame({
+            column: np.load(os.path.join(self.entry_dir, f"{column}.npy"), mmap_mode='r' if mmap else None)
+            for column in manifest['columns']
+        }, copy=False)
+        encoders = {}
+        for name, classes in manifest['vocabularies'].items():
+            encoder = LabelEncoder()
+            encoder.classes_ = np.array(classes, dtype=object)
+            encoders[name] = encoder
+        return df, encoders
+
+    def save(self, df_processed, encoders):
+        """Write an encoded (all-numeric) frame and its encoders as a new entry"""
+        entry_dir = self.entry_dir
+        tmp_dir = f"{entry_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        for column in df_processed.columns:
+            np.save(os.path.join(tmp_dir, f"{column}.npy"), df_processed[column].to_numpy())
+        manifest = {
+            'format_version': DatasetCache.FORMAT_VERSION,
+            'source': os.path.basename(self.csv_path),
+            'source_sha256': self.content_hash,
+            'rows': len(df_processed),
+            'columns': list(df_processed.columns),
+            'dtypes': {column: str(dtype) for column, dtype in df_processed.dtypes.items()},
+            'vocabularies': {name: [str(value) for value in encoder.classes_] for name, encoder in encoders.items()}
+        }
+        with open(os.path.join(tmp_dir, DatasetCache.MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        for stale_dir in glob.glob(os.path.join(self.cache_dir, f"{glob.escape(os.path.basename(self.csv_path))}-*")):
+            if not stale_dir.endswith(".tmp"):
+                shutil.rmtree(stale_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+        return entry_dir
@@ -0,0 +1,137 @@
+FEATURE_COLUMNS = ['Age', 'Gender', 'Academic_Level', 'Country', 'Avg_Daily_Usage_Hours',
+                   'Most_Used_Platform', 'Affects_Academic_Performance', 'Sleep_Hours_Per_Night',
+                   'Mental_Health_Score', 'Conflicts_Over_Social_Media']
+
+TARGET_COLUMN = 'Addicted_Score'
+
+CATEGORICAL_ENCODERS = {
+    'Gender': 'gender',
+    'Academic_Level': 'academic',
+    'Country': 'country',
+    'Most_Used_Platform': 'platform',
+    'Affects_Academic_Performance': 'affects'
+}
+
+NUMERIC_COLUMNS = ['Age', 'Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night',
+                   'Mental_Health_Score', 'Conflicts_Over_Social_Media']
+
+# Declared dtypes of the dataset columns; any other column is dropped at parse time
+DATASET_DTYPES = {
+    'Age': 'int8',
+    'Gender': 'category',
+    'Academic_Level': 'category',
+    'Country': 'category',
+    'Avg_Daily_Usage_Hours': 'float32',
+    'Most_Used_Platform': 'category',
+    'Affects_Academic_Performance': 'category',
+    'Sleep_Hours_Per_Night': 'float32',
+    'Mental_Health_Score': 'int8',
+    'Conflicts_Over_Social_Media': 'int8',
+    TARGET_COLUMN: 'int8'
+}
+
+def read_dataset(file_path):
+    """Read a CSV in the Students_Social_Media_Addiction.csv schema.
+
+    Only the columns in DATASET_DTYPES are parsed. Every column is read as a
+    categorical first, so the header lines repeated inside the file can be
+    dropped before the numeric columns are converted to their declared small
+    dtypes. The target column is optional so unlabelled cohort files can be
+    scored too.
+    """
+    import pandas as pd
+    return _clean_dataset(pd.read_csv(file_path, usecols=lambda name: name in DATASET_DTYPES, dtype='category'))
+
+def read_dataset_chunks(file_path, chunk_size=10000):
+    """Yield the dataset in chunks of at most `chunk_size` rows, cleaned like read_dataset"""
+    import pandas as pd
+    for chunk in pd.read_csv(file_path, usecols=lambda name: name in DATASET_DTYPES, dtype='category',
+                             chunksize=chunk_size):
+        chunk = _clean_dataset(chunk)
+        if len(chunk):
+            yield chunk
+
+def feature_records(df):
+    """The FEATURE_COLUMNS of every row as a user_input dict, in the form the UI builds them.
+
+    The float32 columns are widened through their shortest decimal text, so a
+    CSV value of 5.2 comes back as 5.2 rather than 5.199999809265137 in
+    reports and response-cache keys.
+    """
+    import numpy as np
+    features = df[FEATURE_COLUMNS].copy()
+    for column in FEATURE_COLUMNS:
+        if features[column].dtype == np.float32:
+            features[column] = features[column].to_numpy().astype(str).astype(float)
+    return features.to_dict("records")
+
+def _clean_dataset(df):
+    import numpy as np
+    import pandas as pd
+    df = df[df['Age'] != 'Age'].reset_index(drop=True)
+    for column, dtype in DATASET_DTYPES.items():
+        if column not in df:
+            continue
+        values = df[column].cat.remove_unused_categories()
+        if dtype == 'category':
+            df[column] = values
+            continue
+        codes = values.cat.codes.to_numpy()
+        if (codes < 0).any():
+            raise ValueError(f"Column '{column}' has missing values")
+        numbers = pd.to_numeric(values.cat.categories).to_numpy()
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            _check_integer_values(column, numbers, dtype)
+        df[column] = numbers.astype(dtype)[codes]
+    return df
+
+def _check_integer_values(column, numbers, dtype):
+    """Raise ValueError unless every value is a whole number that fits `dtype` (astype would wrap or truncate)"""
+    import numpy as np
+    limits = np.iinfo(dtype)
+    numbers = numbers.astype(float)
+    bad = ~np.isfinite(numbers) | (numbers != np.round(numbers)) | (numbers < limits.min) | (numbers > limits.max)
+    if bad.any():
+        raise ValueError(f"Column '{column}' has value {numbers[bad][0]:g}, "
+                         f"expected whole numbers in [{limits.min}, {limits.max}] for {dtype}")
+
+class CategoryLookup:
+    """Precompiled category -> code tables used instead of LabelEncoder.transform"""
+
+    @staticmethod
+    def build(encoders, encoded_df=None):
+        """Build one lookup table per encoder.
+
+        Each table maps a category to the code its LabelEncoder assigned and has a
+        `fallback` code for categories never seen in training: the most frequent
+        training category when `encoded_df` is given, otherwise code 0.
+        """
+        lookups = {}
+        for column, encoder_name in CATEGORICAL_ENCODERS.items():
+            classes = list(encoders[encoder_name].classes_)
+            fallback = 0
+            if encoded_df is not None and column in encoded_df:
+                fallback = int(encoded_df[column].value_counts().idxmax())
+            lookups[encoder_name] = {
+                'codes': {value: code for code, value in enumerate(classes)},
+                'classes': classes,
+                'fallback': fallback
+            }
+        return lookups
+
+    @staticmethod
+    def encode_value(lookup, value):
+        """Encode a single category, O(1)"""
+        return lookup['codes'].get(value, lookup['fallback'])
+
+    @staticmethod
+    def encode_column(lookup, values):
+        """Encode a whole column in one vectorized pass"""
+        import numpy as np
+        import pandas as pd
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = np.array([CategoryLookup.encode_value(lookup, value) for value in values.cat.categories]
+                             + [lookup['fallback']])
+            return pd.Series(codes[values.cat.codes.to_numpy()], index=values.index)
+        return values.map(lookup['codes']).fillna(lookup['fallback']).astype(int)
@@ -0,0 +1,79 @@
+import time
+
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV, KFold, ParameterGrid
+
+# Candidate values per model; HyperparameterSearch samples from these lists
+SEARCH_SPACES = {
+    'Random Forest': {
+        'n_estimators': [50, 100, 200, 300],
+        'max_depth': [None, 10, 20, 30],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': [1.0, 0.5, 'sqrt']
+    },
+    'KNN': {
+        'n_neighbors': [3, 5, 7, 9, 15, 25],
+        'leaf_size': [20, 40, 80]
+    },
+    'SVM': {
+        'C': [0.1, 1.0, 10.0, 100.0],
+        'gamma': ['scale', 0.01, 0.1, 1.0],
+        'epsilon': [0.05, 0.1, 0.2]
+    },
+    'Gradient Boosting': {
+        'n_estimators': [100, 200, 400],
+        'learning_rate': [0.03, 0.1, 0.3],
+        'max_depth': [2, 3, 4, 5],
+        'subsample': [0.7, 0.85, 1.0]
+    },
+    'Hist Gradient Boosting': {
+        'learning_rate': [0.03, 0.1, 0.3],
+        'max_leaf_nodes': [15, 31, 63],
+        'min_samples_leaf': [10, 20, 50],
+        'l2_regularization': [0.0, 0.1, 1.0]
+    }
+}
+
+class HyperparameterSearch:
+    """Successive-halving random search over SEARCH_SPACES.
+
+    `n_candidates` configurations are sampled per model and cross-validated on
+    a small subsample of the training rows; each round keeps the best
+    1/`factor` of them and grows the subsample `factor` times, so the last
+    round compares a few survivors on (nearly) all rows. Trials run in
+    `n_jobs` worker processes.
+    """
+
+    def __init__(self, n_candidates=30, factor=3, cv=3, n_jobs=-1, random_state=42):
+        self.n_candidates = n_candidates
+        self.factor = factor
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def settings(self, name):
+        """Everything that determines the search outcome for `name` (n_jobs does not)"""
+        return {'space': SEARCH_SPACES[name], 'n_candidates': self.n_candidates, 'factor': self.factor,
+                'cv': self.cv, 'random_state': self.random_state}
+
+    def run(self, name, estimator, X, y):
+        """Search `name`'s space; return an unfitted estimator with the best parameters and a summary"""
+        space = SEARCH_SPACES[name]
+        n_candidates = min(self.n_candidates, len(ParameterGrid(space)))
+        search = HalvingRandomSearchCV(
+            estimator, space, n_candidates=n_candidates, factor=self.factor,
+            resource='n_samples', min_resources='exhaust', scoring='r2',
+            cv=KFold(n_splits=self.cv, shuffle=True, random_state=self.random_state),
+            refit=False, n_jobs=self.n_jobs, random_state=self.random_state
+        )
+        start = time.perf_counter()
+        search.fit(X, y)
+        summary = {
+            'Best_Params': search.best_params_,
+            'Search_CV_R2': search.best_score_,
+            'Search_Time': time.perf_counter() - start,
+            'Search_Trials': int(sum(search.n_candidates_)),
+            'Search_Rounds': int(search.n_iterations_)
+        }
+        return clone(estimator).set_params(**search.best_params_), summary
@@ -0,0 +1,57 @@
+import numpy as np
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.neighbors import BallTree, KDTree
+
+TREE_CLASSES = {'kd_tree': KDTree, 'ball_tree': BallTree}
+
+class IndexedKNNRegressor(RegressorMixin, BaseEstimator):
+    """K-nearest-neighbors regressor served from an explicit KD-tree or ball-tree.
+
+    The training points live only inside the tree, which is pickled with its
+    node structure so loading does not rebuild the index. Points, node bounds
+    and targets are stored as float32 and widened back to float64 on load.
+    """
+
+    def __init__(self, n_neighbors=5, algorithm='kd_tree', leaf_size=40):
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+
+    def fit(self, X, y):
+        if self.algorithm not in TREE_CLASSES:
+            raise ValueError(f"Unknown algorithm '{self.algorithm}', expected one of {list(TREE_CLASSES)}")
+        X = np.asarray(X, dtype=np.float64)
+        self.tree_ = TREE_CLASSES[self.algorithm](X, leaf_size=self.leaf_size)
+        self.y_ = np.asarray(y, dtype=np.float64)
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        _, indices = self.tree_.query(X, k=self.n_neighbors, return_distance=True)
+        return self.y_[indices].mean(axis=1)
+
+    def __getstate__(self):
+        state = dict(super().__getstate__())
+        if 'tree_' in state:
+            state['tree_'] = (type(self.tree_), _compact_arrays(self.tree_.__getstate__(), np.float32))
+            state['y_'] = state['y_'].astype(np.float32)
+        return state
+
+    def __setstate__(self, state):
+        if 'tree_' in state:
+            tree_class, tree_state = state['tree_']
+            tree = tree_class.__new__(tree_class)
+            tree.__setstate__(_compact_arrays(tree_state, np.float64))
+            state['tree_'] = tree
+            state['y_'] = state['y_'].astype(np.float64)
+        super().__setstate__(state)
+
+def _compact_arrays(tree_state, dtype):
+    """Cast the floating point arrays of a pickled tree (points, node bounds) to `dtype`"""
+    return tuple(
+        part.astype(dtype) if isinstance(part, np.ndarray) and part.dtype.kind == 'f' else part
+        for part in tree_state
+    )
@@ -1,19 +1,50 @@
-import pandas as pd
+import argparse
 import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.neighbors import KNeighborsRegressor
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder
+from sklearn.linear_model import LinearRegression, Ridge, SGDRegressor
+from sklearn.neural_network import MLPRegressor
+from sklearn.kernel_approximation import Nystroem
+from sklearn.pipeline import make_pipeline
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
 from sklearn.svm import SVR
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import joblib
+from joblib import Parallel, delayed
+from knnIndex import IndexedKNNRegressor
+from compiledForest import CompiledForest
+from portableModel import PortableModel
+from featureSchema import CATEGORICAL_ENCODERS, CategoryLookup, read_dataset
+from streamingTrainer import StreamingDataset
+from cvFolds import CrossValidationFolds
+from datasetCache import DatasetCache
+from hyperSearch import SEARCH_SPACES, HyperparameterSearch
+from trainingCheckpoint import TrainingCheckpoint
+from pipelineProfiler import PipelineProfiler
+from config import Config
+import pickle
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
-def load_and_preprocess_data(file_path):
-    """Load and preprocess the social media addiction dataset"""
-    df = pd.read_csv(file_path)
+def load_and_preprocess_data(file_path, use_cache=True, profiler=None):
+    """Load and preprocess the social media addiction dataset.
+
+    The encoded frame and encoders are cached by DatasetCache; while the CSV's
+    content is unchanged later runs load the cached arrays and skip parsing.
+    """
+    profiler = profiler or PipelineProfiler(enabled=False)
+    cache = DatasetCache(file_path, Config.DATASET_CACHE_DIR) if use_cache else None
+    if cache is not None:
+        with profiler.stage('dataset_cache_load'):
+            cached = cache.load()
+        if cached is not None:
+            print(f"Loaded encoded dataset from cache '{cache.entry_dir}' (shape {cached[0].shape})")
+            return cached
+    
+    with profiler.stage('csv_parse'):
+        df = read_dataset(file_path)
     
     print("Dataset shape:", df.shape)
     print("\nDataset info:")
@@ -21,119 +52,471 @@ def load_and_preprocess_data(file_path):
     print("\nFirst few rows:")
     print(df.head())
     
-    le_gender = LabelEncoder()
-    le_academic = LabelEncoder()
-    le_country = LabelEncoder()
-    le_platform = LabelEncoder()
-    le_affects = LabelEncoder()
-    
-    df_processed = df.copy()
-    df_processed['Gender'] = le_gender.fit_transform(df['Gender'])
-    df_processed['Academic_Level'] = le_academic.fit_transform(df['Academic_Level'])
-    df_processed['Country'] = le_country.fit_transform(df['Country'])
-    df_processed['Most_Used_Platform'] = le_platform.fit_transform(df['Most_Used_Platform'])
-    df_processed['Affects_Academic_Performance'] = le_affects.fit_transform(df['Affects_Academic_Performance'])
-    
-    encoders = {
-        'gender': le_gender,
-        'academic': le_academic,
-        'country': le_country,
-        'platform': le_platform,
-        'affects': le_affects
-    }
+    with profiler.stage('encoding'):
+        le_gender = LabelEncoder()
+        le_academic = LabelEncoder()
+        le_country = LabelEncoder()
+        le_platform = LabelEncoder()
+        le_affects = LabelEncoder()
+        
+        df_processed = df.copy()
+        df_processed['Gender'] = le_gender.fit_transform(df['Gender'])
+        df_processed['Academic_Level'] = le_academic.fit_transform(df['Academic_Level'])
+        df_processed['Country'] = le_country.fit_transform(df['Country'])
+        df_processed['Most_Used_Platform'] = le_platform.fit_transform(df['Most_Used_Platform'])
+        df_processed['Affects_Academic_Performance'] = le_affects.fit_transform(df['Affects_Academic_Performance'])
+        
+        encoders = {
+            'gender': le_gender,
+            'academic': le_academic,
+            'country': le_country,
+            'platform': le_platform,
+            'affects': le_affects
+        }
+        for column, encoder_name in CATEGORICAL_ENCODERS.items():
+            code_dtype = np.min_scalar_type(len(encoders[encoder_name].classes_) - 1)
+            df_processed[column] = df_processed[column].astype(code_dtype)
+    
+    if cache is not None:
+        with profiler.stage('dataset_cache_save'):
+            print(f"Cached encoded dataset in '{cache.save(df_processed, encoders)}'")
     
     return df_processed, encoders
 
-def train_models(X_train, X_test, y_train, y_test):
-    """Train all 5 models and evaluate their performance"""
+SCALED_MODELS = ['SVM', 'KNN', 'SVM (Nystroem)', 'SGD Regressor', 'MLP Regressor']
+
+def _fit_and_predict(model, X_fit, y_fit, X_eval, feature_names=None):
+    """Fit a fresh clone of `model` and time its fit and predict calls.
+
+    With `feature_names` the arrays are fit as DataFrames so the model records
+    its column names, as when it is served on DataFrame input.
+    """
+    if feature_names is not None:
+        import pandas as pd
+        X_fit = pd.DataFrame(X_fit, columns=feature_names)
+        X_eval = pd.DataFrame(X_eval, columns=feature_names)
+    model = clone(model)
+    fit_start = time.perf_counter()
+    model.fit(X_fit, y_fit)
+    fit_time = time.perf_counter() - fit_start
+    predict_start = time.perf_counter()
+    y_pred = model.predict(X_eval)
+    predict_time = time.perf_counter() - predict_start
+    return model, y_pred, fit_time, predict_time
+
+def approximate_svr(n_features, n_components=500):
+    """RBF kernel regression via a Nystroem feature map and a linear model.
+
+    Fit cost grows linearly with the number of rows instead of the quadratic to
+    cubic growth of the exact SVR. gamma matches SVR(gamma='scale') on
+    standardized features.
+    """
+    return make_pipeline(
+        Nystroem(kernel='rbf', gamma=1.0 / n_features, n_components=n_components, random_state=42),
+        Ridge(alpha=1.0)
+    )
+
+SELECTION_POLICIES = ['best_r2', 'latency_budget', 'smallest_within_epsilon']
+
+def measure_inference(model, X_eval, repeats=200):
+    """Single-row p50/p99 latency, batch latency per row and pickled size of a fitted model.
+
+    Single rows are timed on the path that serves them: CompiledForest.predict_one
+    for tree ensembles (see save_best_model and ModelHandler.make_prediction),
+    the model's own predict otherwise. The whole-set batch is scored with
+    predict, as ModelHandler.predict_batch does for large batches.
+    """
+    compiled_model = CompiledForest.from_estimator(model) if CompiledForest.supports(model) else None
+    X_values = np.asarray(X_eval, dtype=float) if compiled_model is not None else None
+    single_row_ms = []
+    for i in range(repeats):
+        row_index = i % len(X_eval)
+        if compiled_model is not None:
+            row = X_values[row_index]
+            start = time.perf_counter()
+            compiled_model.predict_one(row)
+        else:
+            row = X_eval.iloc[row_index:row_index + 1] if hasattr(X_eval, 'iloc') else X_eval[row_index:row_index + 1]
+            start = time.perf_counter()
+            model.predict(row)
+        single_row_ms.append((time.perf_counter() - start) * 1000)
+    
+    start = time.perf_counter()
+    model.predict(X_eval)
+    batch_us = (time.perf_counter() - start) * 1e6 / len(X_eval)
     
+    return {
+        'Latency_P50_ms': float(np.percentile(single_row_ms, 50)),
+        'Latency_P99_ms': float(np.percentile(single_row_ms, 99)),
+        'Batch_Latency_us': batch_us,
+        'Model_Size_KB': len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)) / 1024,
+        'Serving_Path': 'compiled' if compiled_model is not None else 'predict'
+    }
+
+def candidate_models(n_features, include_approximate_svr=False):
+    """The default-configured candidate models, keyed by display name"""
     models = {
         'Linear Regression': LinearRegression(),
         'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42),
-        'KNN': KNeighborsRegressor(n_neighbors=5),
+        'KNN': IndexedKNNRegressor(n_neighbors=5, algorithm='kd_tree'),
         'SVM': SVR(kernel='rbf', C=1.0, gamma='scale'),
-        'Gradient Boosting': GradientBoostingRegressor(n_estimators=100, random_state=42)
+        'Gradient Boosting': GradientBoostingRegressor(n_estimators=100, random_state=42),
+        'Hist Gradient Boosting': HistGradientBoostingRegressor(
+            max_iter=500, early_stopping=True, validation_fraction=0.1, n_iter_no_change=10, tol=1e-3,
+            random_state=42
+        )
     }
+    if include_approximate_svr:
+        models['SVM (Nystroem)'] = approximate_svr(n_features)
+    return models
+
+def train_models(X_train, X_test, y_train, y_test, n_jobs=-1, include_approximate_svr=False, search=None,
+                 checkpoint_dir=None, profiler=None):
+    """Train all candidate models and evaluate their performance.
+
+    Every holdout fit and every cross-validation fold of every model is an
+    independent task, so all of them are spread over `n_jobs` worker processes
+    (-1 uses all cores, 1 trains sequentially in this process). The fold
+    matrices, scaled per fold, come from one shared CrossValidationFolds. With
+    `include_approximate_svr` a Nystroem-approximated SVR is trained as well.
+    With a HyperparameterSearch as `search` every model that has a search space
+    is first tuned on the training split and trained with its best parameters.
+    With `checkpoint_dir` every finished model is saved there and reused by later
+    runs on the same data with the same configuration (see TrainingCheckpoint).
+    Stages are timed by `profiler`, a PipelineProfiler.
+    """
     
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
+    profiler = profiler or PipelineProfiler(enabled=False)
+    models = candidate_models(X_train.shape[1], include_approximate_svr)
     
     results = {}
     trained_models = {}
     
-    print("Training and evaluating models...")
+    print(f"Training and evaluating models (n_jobs={n_jobs})...")
     print("="*60)
     
-    for name, model in models.items():
-        print(f"\nTraining {name}...")
-        
-        if name in ['SVM', 'KNN']:
-            model.fit(X_train_scaled, y_train)
-            y_pred = model.predict(X_test_scaled)
-            cv_scores = cross_val_score(model, X_train_scaled, y_train, cv=5, scoring='r2')
-        else:
-            model.fit(X_train, y_train)
-            y_pred = model.predict(X_test)
-            cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='r2')
+    with profiler.stage('checkpoint_lookup'):
+        checkpoint = TrainingCheckpoint(checkpoint_dir, X_train, X_test, y_train, y_test) if checkpoint_dir else None
+        completed = {}
+        keys = {}
+        if checkpoint is not None:
+            for name, model in models.items():
+                keys[name] = checkpoint.key(name, model, search if name in SEARCH_SPACES else None)
+                entry = checkpoint.load(name, keys[name])
+                if entry is not None:
+                    completed[name] = entry
+            if completed:
+                print(f"Reusing checkpointed results for: {', '.join(completed)}")
+    pending = [name for name in models if name not in completed]
+    
+    with profiler.stage('scaler_fit_and_folds'):
+        folds = CrossValidationFolds(X_train, X_test, y_train, n_splits=5)
+    with folds:
+        scaler = folds.scaler
+        search_summaries = {}
+        if search is not None:
+            for name in [name for name in pending if name in SEARCH_SPACES]:
+                X_fit, y_fit, _ = folds.holdout(scaled=name in SCALED_MODELS)
+                print(f"Searching hyperparameters for {name}...")
+                with profiler.stage(f'hyperparameter_search/{name}'):
+                    models[name], search_summaries[name] = search.run(name, models[name], X_fit, y_fit)
         
-        mse = mean_squared_error(y_test, y_pred)
-        rmse = np.sqrt(mse)
-        mae = mean_absolute_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
-        cv_mean = cv_scores.mean()
-        cv_std = cv_scores.std()
+        tasks = []
+        for name in pending:
+            scaled = name in SCALED_MODELS
+            tasks.append((name, None, models[name], *folds.holdout(scaled), None if scaled else folds.feature_names))
+            for fold in range(folds.n_splits):
+                tasks.append((name, fold, models[name], *folds.fold(fold, scaled), None))
         
+        # Results arrive in task order while later tasks keep running, so each model is
+        # checkpointed as soon as its holdout fit and all of its folds are in
+        with profiler.stage('model_fits'):
+            outputs = Parallel(n_jobs=n_jobs, return_as='generator')(
+                delayed(_fit_and_predict)(*task[2:]) for task in tasks
+            )
+            
+            for (name, fold, *_), (model, y_pred, fit_time, predict_time) in zip(tasks, outputs):
+                entry = completed.setdefault(name, {'cv_folds': [], 'search_summary': search_summaries.get(name, {})})
+                if fold is None:
+                    entry.update(model=model, y_pred=y_pred, fit_time=fit_time, predict_time=predict_time)
+                else:
+                    entry['cv_folds'].append({**folds.fold_metrics(fold, y_pred), 'Fit_Time': fit_time})
+                if checkpoint is not None and len(entry['cv_folds']) == folds.n_splits and 'model' in entry:
+                    checkpoint.save(name, keys[name], entry)
+    
+    with profiler.stage('evaluation'):
+        for name in models:
+            entry = completed[name]
+            model, y_pred, fit_time, predict_time = entry['model'], entry['y_pred'], entry['fit_time'], entry['predict_time']
+            X_eval = scaler.transform(X_test) if name in SCALED_MODELS else X_test
+            cv_scores = [fold_metrics['R2'] for fold_metrics in entry['cv_folds']]
+            cv_fit_time = sum(fold_metrics['Fit_Time'] for fold_metrics in entry['cv_folds'])
+            
+            mse = mean_squared_error(y_test, y_pred)
+            rmse = np.sqrt(mse)
+            mae = mean_absolute_error(y_test, y_pred)
+            r2 = r2_score(y_test, y_pred)
+            cv_mean = np.mean(cv_scores)
+            cv_std = np.std(cv_scores)
+            
+            results[name] = {
+                'MSE': mse,
+                'RMSE': rmse,
+                'MAE': mae,
+                'R2_Score': r2,
+                'CV_Mean': cv_mean,
+                'CV_Std': cv_std,
+                'Accuracy_Percentage': max(0, r2 * 100),
+                'Fit_Time': fit_time,
+                'Predict_Time': predict_time,
+                'CV_Fit_Time': cv_fit_time,
+                'CV_Folds': entry['cv_folds'],
+                'Best_Params': {},
+                'Search_Time': 0.0,
+                **entry['search_summary'],
+                **measure_inference(model, X_eval)
+            }
+            metrics = results[name]
+            
+            trained_models[name] = model
+            
+            print(f"\nResults for {name}:")
+            print(f"  RMSE: {rmse:.4f}")
+            print(f"  MAE: {mae:.4f}")
+            print(f"  R² Score: {r2:.4f}")
+            print(f"  Accuracy: {max(0, r2 * 100):.2f}%")
+            print(f"  CV Score: {cv_mean:.4f} (±{cv_std:.4f})")
+            print(f"  Fit time: {fit_time:.2f}s | Predict time: {predict_time:.3f}s | CV fit time: {cv_fit_time:.2f}s")
+            print("  CV folds (R² / RMSE): " + ", ".join(f"{fold_metrics['R2']:.4f} / {fold_metrics['RMSE']:.4f}"
+                                                     for fold_metrics in entry['cv_folds']))
+            print(f"  Single-row latency: p50 {metrics['Latency_P50_ms']:.3f}ms / p99 {metrics['Latency_P99_ms']:.3f}ms | "
+                  f"Batch: {metrics['Batch_Latency_us']:.2f}µs/row | Size: {metrics['Model_Size_KB']:.1f} KB")
+            if entry['search_summary']:
+                print(f"  Best params: {metrics['Best_Params']} (search CV R² {metrics['Search_CV_R2']:.4f}, "
+                      f"{metrics['Search_Trials']} trials in {metrics['Search_Rounds']} rounds, {metrics['Search_Time']:.1f}s)")
+            if isinstance(model, HistGradientBoostingRegressor) and model.early_stopping:
+                print(f"  Boosting iterations (early stopping): {model.n_iter_}")
+    
+    return results, trained_models, scaler
+
+def streaming_models():
+    """Candidates that learn incrementally through partial_fit"""
+    return {
+        'SGD Regressor': SGDRegressor(random_state=42),
+        'MLP Regressor': MLPRegressor(hidden_layer_sizes=(64, 32), random_state=42)
+    }
+
+def train_models_streaming(dataset, epochs=5):
+    """Train the partial_fit candidates out of core on a StreamingDataset.
+
+    Each epoch streams the training chunks once, shuffling rows within a chunk,
+    and feeds every model the scaled chunk. The holdout rows are then streamed
+    once and the metrics accumulated from running sums, so memory stays bounded
+    by the chunk size. There is no cross-validation in this mode.
+    """
+    models = streaming_models()
+    fit_times = {name: 0.0 for name in models}
+    rng = np.random.RandomState(42)
+    
+    print(f"Streaming {dataset.n_train} training rows in chunks of {dataset.chunk_size} for {epochs} epochs...")
+    print("="*60)
+    
+    for epoch in range(epochs):
+        for X, y in dataset.chunks('train'):
+            order = rng.permutation(len(X))
+            X_scaled, y = dataset.scaler.transform(X[order]), y[order]
+            for name, model in models.items():
+                start = time.perf_counter()
+                model.partial_fit(X_scaled, y)
+                fit_times[name] += time.perf_counter() - start
+    
+    squared_errors = {name: 0.0 for name in models}
+    absolute_errors = {name: 0.0 for name in models}
+    predict_times = {name: 0.0 for name in models}
+    n_test, sum_y, sum_y2 = 0, 0.0, 0.0
+    X_last = None
+    for X, y in dataset.chunks('test'):
+        X_last = dataset.scaler.transform(X)
+        n_test += len(y)
+        sum_y += y.sum()
+        sum_y2 += (y ** 2).sum()
+        for name, model in models.items():
+            start = time.perf_counter()
+            y_pred = model.predict(X_last)
+            predict_times[name] += time.perf_counter() - start
+            squared_errors[name] += ((y - y_pred) ** 2).sum()
+            absolute_errors[name] += np.abs(y - y_pred).sum()
+    
+    results = {}
+    total_sum_squares = sum_y2 - sum_y ** 2 / n_test
+    for name, model in models.items():
+        mse = squared_errors[name] / n_test
+        mae = absolute_errors[name] / n_test
+        r2 = 1 - squared_errors[name] / total_sum_squares
         results[name] = {
             'MSE': mse,
-            'RMSE': rmse,
+            'RMSE': np.sqrt(mse),
             'MAE': mae,
             'R2_Score': r2,
-            'CV_Mean': cv_mean,
-            'CV_Std': cv_std,
-            'Accuracy_Percentage': max(0, r2 * 100) 
+            'CV_Mean': float('nan'),
+            'CV_Std': float('nan'),
+            'Accuracy_Percentage': max(0, r2 * 100),
+            'Fit_Time': fit_times[name],
+            'Predict_Time': predict_times[name],
+            'CV_Fit_Time': 0.0,
+            **measure_inference(model, X_last)
         }
-        
-        trained_models[name] = model
-        
-        print(f"Results for {name}:")
-        print(f"  RMSE: {rmse:.4f}")
+        metrics = results[name]
+        print(f"\nResults for {name}:")
+        print(f"  RMSE: {metrics['RMSE']:.4f}")
         print(f"  MAE: {mae:.4f}")
         print(f"  R² Score: {r2:.4f}")
-        print(f"  Accuracy: {max(0, r2 * 100):.2f}%")
-        print(f"  CV Score: {cv_mean:.4f} (±{cv_std:.4f})")
+        print(f"  Fit time: {fit_times[name]:.2f}s | Predict time: {predict_times[name]:.3f}s")
+        print(f"  Single-row latency: p50 {metrics['Latency_P50_ms']:.3f}ms / p99 {metrics['Latency_P99_ms']:.3f}ms | "
+              f"Size: {metrics['Model_Size_KB']:.1f} KB")
     
-    return results, trained_models, scaler
+    return results, models, dataset.scaler
+
+def find_best_model(results, max_fit_time=None, max_predict_time=None, policy='best_r2',
+                    latency_budget_ms=None, r2_epsilon=0.001):
+    """Find the best model under a selection policy.
 
-def find_best_model(results):
-    """Find the best performing model based on R² score"""
-    best_model_name = max(results.keys(), key=lambda x: results[x]['R2_Score'])
+    Models whose holdout fit time or predict time (in seconds) exceed the given
+    budgets are skipped; if no model fits the budgets all models are considered.
+    Policies:
+      best_r2                  highest R² score
+      latency_budget           highest R² among models with p99 single-row latency <= latency_budget_ms
+                               (the fastest model if none qualifies)
+      smallest_within_epsilon  smallest serialized model with R² >= best R² - r2_epsilon
+    """
+    if policy not in SELECTION_POLICIES:
+        raise ValueError(f"Unknown selection policy '{policy}', expected one of {SELECTION_POLICIES}")
+    
+    candidates = [
+        name for name, metrics in results.items()
+        if (max_fit_time is None or metrics['Fit_Time'] <= max_fit_time)
+        and (max_predict_time is None or metrics['Predict_Time'] <= max_predict_time)
+    ]
+    if not candidates:
+        print("\n⚠️ No model meets the time budgets; selecting on R² alone.")
+        candidates = list(results.keys())
+    
+    if policy == 'latency_budget':
+        if latency_budget_ms is None:
+            raise ValueError("The 'latency_budget' policy needs latency_budget_ms")
+        within_budget = [name for name in candidates if results[name]['Latency_P99_ms'] <= latency_budget_ms]
+        if not within_budget:
+            print(f"\n⚠️ No model meets the {latency_budget_ms}ms p99 budget; selecting the fastest model.")
+            best_model_name = min(candidates, key=lambda x: results[x]['Latency_P99_ms'])
+            return best_model_name, results[best_model_name]
+        candidates = within_budget
+    elif policy == 'smallest_within_epsilon':
+        best_r2 = max(results[name]['R2_Score'] for name in candidates)
+        close_enough = [name for name in candidates if results[name]['R2_Score'] >= best_r2 - r2_epsilon]
+        best_model_name = min(close_enough, key=lambda x: results[x]['Model_Size_KB'])
+        return best_model_name, results[best_model_name]
+    
+    best_model_name = max(candidates, key=lambda x: results[x]['R2_Score'])
     return best_model_name, results[best_model_name]
 
-def save_best_model(best_model_name, trained_models, scaler, encoders):
-    """Save the best model and preprocessing objects"""
+def save_best_model(best_model_name, trained_models, scaler, encoders, category_lookups=None, selection=None,
+                    profiler=None):
+    """Save the best model, preprocessing objects, precompiled category lookup tables
+    and the selection policy with the measurements it was applied to.
+
+    Tree ensembles are also exported as a CompiledForest for low-latency serving.
+    """
+    profiler = profiler or PipelineProfiler(enabled=False)
     best_model = trained_models[best_model_name]
+    with profiler.stage('compile_model'):
+        compiled_model = CompiledForest.from_estimator(best_model) if CompiledForest.supports(best_model) else None
     
     model_package = {
         'model': best_model,
         'model_name': best_model_name,
-        'scaler': scaler if best_model_name in ['SVM', 'KNN'] else None,
+        'compiled_model': compiled_model,
+        'scaler': scaler if best_model_name in SCALED_MODELS else None,
         'encoders': encoders,
+        'category_lookups': category_lookups if category_lookups is not None else CategoryLookup.build(encoders),
+        'selection': selection,
         'feature_names': ['Age', 'Gender', 'Academic_Level', 'Country', 'Avg_Daily_Usage_Hours',
                          'Most_Used_Platform', 'Affects_Academic_Performance', 'Sleep_Hours_Per_Night',
                          'Mental_Health_Score', 'Conflicts_Over_Social_Media']
     }
     
-    joblib.dump(model_package, 'best_addiction_model.pkl')
+    with profiler.stage('joblib_dump'):
+        joblib.dump(model_package, 'best_addiction_model.pkl')
     print(f"\nBest model '{best_model_name}' saved as 'best_addiction_model.pkl'")
     
+    with profiler.stage('portable_export'):
+        PortableModel.export(model_package, 'best_addiction_model', source_file='best_addiction_model.pkl')
+    print("Portable export written to 'best_addiction_model/'")
+    
     return model_package
 
-def main():
-    """Main function to run the entire pipeline"""
+def select_and_save(results, trained_models, scaler, encoders, category_lookups, max_fit_time=None,
+                    max_predict_time=None, selection_policy='best_r2', latency_budget_ms=None, r2_epsilon=0.001,
+                    profiler=None):
+    """Print the comparison summary, pick the winner under the selection policy and save it"""
+    print("\n" + "="*60)
+    print("MODEL COMPARISON SUMMARY")
+    print("="*60)
+    
+    for name, metrics in results.items():
+        print(f"{name:20} | R²: {metrics['R2_Score']:.4f} | RMSE: {metrics['RMSE']:.4f} | Accuracy: {metrics['Accuracy_Percentage']:.2f}% "
+              f"| Fit: {metrics['Fit_Time']:.2f}s | Predict: {metrics['Predict_Time']:.3f}s")
+    
+    best_model_name, best_metrics = find_best_model(
+        results, max_fit_time, max_predict_time, selection_policy, latency_budget_ms, r2_epsilon
+    )
+    selection = {
+        'policy': selection_policy,
+        'latency_budget_ms': latency_budget_ms,
+        'r2_epsilon': r2_epsilon,
+        'max_fit_time': max_fit_time,
+        'max_predict_time': max_predict_time,
+        'measurements': results
+    }
+    
+    print(f"\n🏆 BEST MODEL: {best_model_name}")
+    print(f"   R² Score: {best_metrics['R2_Score']:.4f}")
+    print(f"   RMSE: {best_metrics['RMSE']:.4f}")
+    print(f"   Accuracy: {best_metrics['Accuracy_Percentage']:.2f}%")
+    print(f"   Cross-validation: {best_metrics['CV_Mean']:.4f} (±{best_metrics['CV_Std']:.4f})")
+    print(f"   Selection policy: {selection_policy} | p99 latency: {best_metrics['Latency_P99_ms']:.3f}ms | "
+          f"Size: {best_metrics['Model_Size_KB']:.1f} KB")
+    if best_metrics.get('Best_Params'):
+        print(f"   Tuned parameters: {best_metrics['Best_Params']}")
+    
+    return save_best_model(best_model_name, trained_models, scaler, encoders, category_lookups, selection, profiler)
+
+def write_run_report(profiler, results, model_package):
+    """Add per-model timings and the selected model to the profiler's report and write it"""
+    profiler.record('models', {
+        name: {key: metrics[key] for key in ('Fit_Time', 'Predict_Time', 'CV_Fit_Time', 'Search_Time',
+                                             'Latency_P99_ms', 'Model_Size_KB', 'R2_Score') if key in metrics}
+        for name, metrics in results.items()
+    })
+    profiler.record('selected_model', model_package['model_name'])
+    report_path = profiler.write_report(Config.RUN_REPORT_FILE)
+    print(f"Run report written to '{report_path}'")
+
+def main(n_jobs=-1, include_approximate_svr=False, max_fit_time=None, max_predict_time=None,
+         selection_policy='best_r2', latency_budget_ms=None, r2_epsilon=0.001, use_dataset_cache=True,
+         search_candidates=None, use_checkpoints=True, profile_stage=None):
+    """Main function to run the entire pipeline.
+
+    Every stage is timed and a JSON run report is written to Config.RUN_REPORT_FILE;
+    `profile_stage` names a stage to run under cProfile.
+    """
+    profiler = PipelineProfiler(profile_stage=profile_stage)
+    profiler.record('run', {'mode': 'in_memory', 'n_jobs': n_jobs, 'selection_policy': selection_policy,
+                            'search_candidates': search_candidates, 'use_dataset_cache': use_dataset_cache,
+                            'use_checkpoints': use_checkpoints})
     
     print("Loading and preprocessing data...")
-    df, encoders = load_and_preprocess_data('Students_Social_Media_Addiction.csv')
+    with profiler.stage('load_data'):
+        df, encoders = load_and_preprocess_data('Students_Social_Media_Addiction.csv', use_dataset_cache, profiler)
     
     feature_columns = ['Age', 'Gender', 'Academic_Level', 'Country', 'Avg_Daily_Usage_Hours',
                       'Most_Used_Platform', 'Affects_Academic_Performance', 'Sleep_Hours_Per_Night',
@@ -146,28 +529,26 @@ def main():
     print(f"Target shape: {y.shape}")
     print(f"Target range: {y.min()} to {y.max()}")
     
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    with profiler.stage('train_test_split'):
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
     print(f"\nTraining set size: {X_train.shape[0]}")
     print(f"Testing set size: {X_test.shape[0]}")
     
-    results, trained_models, scaler = train_models(X_train, X_test, y_train, y_test)
-    
-    print("\n" + "="*60)
-    print("MODEL COMPARISON SUMMARY")
-    print("="*60)
-    
-    for name, metrics in results.items():
-        print(f"{name:20} | R²: {metrics['R2_Score']:.4f} | RMSE: {metrics['RMSE']:.4f} | Accuracy: {metrics['Accuracy_Percentage']:.2f}%")
-    
-    best_model_name, best_metrics = find_best_model(results)
-    
-    print(f"\n🏆 BEST MODEL: {best_model_name}")
-    print(f"   R² Score: {best_metrics['R2_Score']:.4f}")
-    print(f"   RMSE: {best_metrics['RMSE']:.4f}")
-    print(f"   Accuracy: {best_metrics['Accuracy_Percentage']:.2f}%")
-    print(f"   Cross-validation: {best_metrics['CV_Mean']:.4f} (±{best_metrics['CV_Std']:.4f})")
+    search = HyperparameterSearch(n_candidates=search_candidates, n_jobs=n_jobs) if search_candidates else None
+    with profiler.stage('train_models'):
+        results, trained_models, scaler = train_models(
+            X_train, X_test, y_train, y_test, n_jobs=n_jobs, include_approximate_svr=include_approximate_svr,
+            search=search, checkpoint_dir=Config.CHECKPOINT_DIR if use_checkpoints else None, profiler=profiler
+        )
     
-    model_package = save_best_model(best_model_name, trained_models, scaler, encoders)
+    with profiler.stage('category_lookups'):
+        category_lookups = CategoryLookup.build(encoders, df)
+    with profiler.stage('select_and_save'):
+        model_package = select_and_save(
+            results, trained_models, scaler, encoders, category_lookups,
+            max_fit_time, max_predict_time, selection_policy, latency_budget_ms, r2_epsilon, profiler
+        )
+    write_run_report(profiler, results, model_package)
     
     print("\n" + "="*60)
     print("TESTING SAVED MODEL")
@@ -192,5 +573,83 @@ def main():
     
     return model_package, results
 
+def main_streaming(chunk_size=10000, epochs=5, max_fit_time=None, max_predict_time=None,
+                   selection_policy='best_r2', latency_budget_ms=None, r2_epsilon=0.001, profile_stage=None):
+    """Out-of-core pipeline: peak memory is bounded by `chunk_size`, not by the size of the CSV"""
+    
+    profiler = PipelineProfiler(profile_stage=profile_stage)
+    profiler.record('run', {'mode': 'streaming', 'chunk_size': chunk_size, 'epochs': epochs,
+                            'selection_policy': selection_policy})
+    dataset = StreamingDataset('Students_Social_Media_Addiction.csv', chunk_size=chunk_size)
+    print("Building category vocabularies...")
+    with profiler.stage('build_vocabularies'):
+        encoders = dataset.build_vocabularies()
+    print("Fitting scaler...")
+    with profiler.stage('scaler_fit'):
+        dataset.fit_scaler()
+    
+    with profiler.stage('train_models'):
+        results, trained_models, scaler = train_models_streaming(dataset, epochs)
+    
+    with profiler.stage('select_and_save'):
+        model_package = select_and_save(
+            results, trained_models, scaler, encoders, dataset.category_lookups,
+            max_fit_time, max_predict_time, selection_policy, latency_budget_ms, r2_epsilon, profiler
+        )
+    write_run_report(profiler, results, model_package)
+    return model_package, results
+
 if __name__ == "__main__":
-    model_package, results = main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Train and select the social media addiction model")
+    parser.add_argument("--n-jobs", type=int, default=-1,
+                        help="Worker processes for model fits and CV folds (-1 = all cores, 1 = sequential)")
+    parser.add_argument("--approximate-svr", action="store_true",
+                        help="Also train a Nystroem-approximated SVR that scales to large training sets")
+    parser.add_argument("--max-fit-time", type=float, default=None,
+                        help="Only select models whose holdout fit took at most this many seconds")
+    parser.add_argument("--max-predict-time", type=float, default=None,
+                        help="Only select models whose holdout predict took at most this many seconds")
+    parser.add_argument("--selection-policy", choices=SELECTION_POLICIES, default='best_r2',
+                        help="How find_best_model picks the winner")
+    parser.add_argument("--latency-budget-ms", type=float, default=None,
+                        help="p99 single-row latency budget for the latency_budget policy")
+    parser.add_argument("--r2-epsilon", type=float, default=0.001,
+                        help="Allowed R² gap from the best model for the smallest_within_epsilon policy")
+    parser.add_argument("--stream-chunk-size", type=int, default=None,
+                        help="Train partial_fit models out of core, reading the CSV in chunks of this many rows")
+    parser.add_argument("--epochs", type=int, default=5, help="Passes over the data in streaming mode")
+    parser.add_argument("--no-dataset-cache", action="store_true",
+                        help="Always parse the CSV instead of reusing the encoded columnar cache")
+    parser.add_argument("--search", type=int, default=None, metavar="CANDIDATES",
+                        help="Tune each model with a successive-halving search over this many sampled configurations")
+    parser.add_argument("--no-checkpoints", action="store_true",
+                        help="Retrain every model instead of reusing checkpointed results from earlier runs")
+    parser.add_argument("--profile-stage", default=None, metavar="STAGE",
+                        help="Run this pipeline stage under cProfile (e.g. csv_parse, model_fits, joblib_dump); "
+                             "stats are saved next to the run report")
+    args = parser.parse_args()
+    if args.stream_chunk_size:
+        model_package, results = main_streaming(
+            chunk_size=args.stream_chunk_size,
+            epochs=args.epochs,
+            max_fit_time=args.max_fit_time,
+            max_predict_time=args.max_predict_time,
+            selection_policy=args.selection_policy,
+            latency_budget_ms=args.latency_budget_ms,
+            r2_epsilon=args.r2_epsilon,
+            profile_stage=args.profile_stage
+        )
+    else:
+        model_package, results = main(
+            n_jobs=args.n_jobs,
+            include_approximate_svr=args.approximate_svr,
+            max_fit_time=args.max_fit_time,
+            max_predict_time=args.max_predict_time,
+            selection_policy=args.selection_policy,
+            latency_budget_ms=args.latency_budget_ms,
+            r2_epsilon=args.r2_epsilon,
+            use_dataset_cache=not args.no_dataset_cache,
+            search_candidates=args.search,
+            use_checkpoints=not args.no_checkpoints,
+            profile_stage=args.profile_stage
+        )
\ No newline at end of file
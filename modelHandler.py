@@ -1,41 +1,84 @@
-import joblib
+import os
+import warnings
 import streamlit as st
 from config import Config
-import pandas as pd
+from featureSchema import CATEGORICAL_ENCODERS, CategoryLookup
+from portableModel import PortableModel
+import numpy as np
 
 class ModelHandler:
     """Class to handle model operations"""
     
+    # Above this many rows sklearn's compiled tree traversal beats the NumPy CompiledForest
+    COMPILED_BATCH_MAX_ROWS = 1000
+    
+    @staticmethod
+    def default_model_path():
+        """The portable export directory when it was made from the current joblib package, otherwise the package.
+
+        A stale export (e.g. after a pull brought in a retrained .pkl) is skipped with a warning.
+        """
+        if not PortableModel.is_export(Config.MODEL_DIR):
+            return Config.MODEL_FILE
+        if not os.path.exists(Config.MODEL_FILE) or PortableModel.matches_source(Config.MODEL_DIR, Config.MODEL_FILE):
+            return Config.MODEL_DIR
+        warnings.warn(f"Export '{Config.MODEL_DIR}' was not made from the current '{Config.MODEL_FILE}'; "
+                      f"serving '{Config.MODEL_FILE}' instead. Re-export it with "
+                      f"`python portableModel.py {Config.MODEL_FILE} {Config.MODEL_DIR}`.", RuntimeWarning)
+        return Config.MODEL_FILE
+    
+    @staticmethod
+    def read_model_package(model_file=None):
+        """Read a joblib package or a portable export directory without any Streamlit error handling"""
+        model_file = model_file or ModelHandler.default_model_path()
+        if os.path.isdir(model_file):
+            model_package = PortableModel.load(model_file)
+        else:
+            import joblib
+            model_package = joblib.load(model_file)
+        ModelHandler.get_category_lookups(model_package)
+        return model_package
+    
     @staticmethod
     @st.cache_resource
     def load_model():
         """Load the trained model package"""
+        model_file = ModelHandler.default_model_path()
         try:
-            model_package = joblib.load(Config.MODEL_FILE)
+            model_package = ModelHandler.read_model_package(model_file)
             return model_package
         except FileNotFoundError:
-            st.error(f"❌ Model file '{Config.MODEL_FILE}' not found. Please run the training script first.")
+            st.error(f"❌ Model file '{model_file}' not found. Please run the training script first.")
             return None
         except Exception as e:
             st.error(f"❌ Error loading model: {str(e)}")
             return None
     
+    @staticmethod
+    def get_category_lookups(model_package):
+        """Return the package's precompiled lookup tables, building them for older packages"""
+        if 'category_lookups' not in model_package:
+            model_package['category_lookups'] = CategoryLookup.build(model_package['encoders'])
+        return model_package['category_lookups']
+    
     @staticmethod
     def make_prediction(model_package, user_input):
         """Make prediction using the loaded model"""
         try:
-            input_df = pd.DataFrame([user_input])
+            lookups = ModelHandler.get_category_lookups(model_package)
             
-            encoders = model_package['encoders']
-            
-            input_df['Gender'] = encoders['gender'].transform([user_input['Gender']])[0]
-            input_df['Academic_Level'] = encoders['academic'].transform([user_input['Academic_Level']])[0]
-            input_df['Country'] = encoders['country'].transform([user_input['Country']])[0]
-            input_df['Most_Used_Platform'] = encoders['platform'].transform([user_input['Most_Used_Platform']])[0]
-            input_df['Affects_Academic_Performance'] = encoders['affects'].transform([user_input['Affects_Academic_Performance']])[0]
+            encoded_input = dict(user_input)
+            for column, encoder_name in CATEGORICAL_ENCODERS.items():
+                encoded_input[column] = CategoryLookup.encode_value(lookups[encoder_name], user_input[column])
             
             feature_order = model_package['feature_names']
-            input_features = input_df[feature_order]
+            compiled_model = model_package.get('compiled_model')
+            if compiled_model is not None:
+                prediction = compiled_model.predict_one([encoded_input[name] for name in feature_order])
+                return max(0, min(10, prediction))
+            
+            import pandas as pd
+            input_features = pd.DataFrame([[encoded_input[name] for name in feature_order]], columns=feature_order)
             
             if model_package['scaler'] is not None:
                 input_features = model_package['scaler'].transform(input_features)
@@ -47,3 +90,39 @@ class ModelHandler:
         except Exception as e:
             st.error(f"❌ Prediction error: {str(e)}")
             return None
+
+
+    @staticmethod
+    def predict_batch(model_package, records):
+        """Score many users at once.
+
+        `records` is a DataFrame or a list of user_input dicts. Each categorical
+        column is encoded in one vectorized lookup pass, the scaler and the model run
+        once over the whole matrix (the CompiledForest for small batches of tree
+        models) and scores are clipped to [0, 10]. Errors are
+        raised to the caller instead of being reported through Streamlit.
+        """
+        import pandas as pd
+        if isinstance(records, pd.DataFrame):
+            input_df = records
+        else:
+            input_df = pd.DataFrame.from_records(list(records))
+
+        if len(input_df) == 0:
+            return np.empty(0)
+
+        input_features = input_df[model_package['feature_names']].copy()
+
+        lookups = ModelHandler.get_category_lookups(model_package)
+        for column, encoder_name in CATEGORICAL_ENCODERS.items():
+            input_features[column] = CategoryLookup.encode_column(lookups[encoder_name], input_features[column])
+
+        compiled_model = model_package.get('compiled_model')
+        if compiled_model is not None and len(input_features) <= ModelHandler.COMPILED_BATCH_MAX_ROWS:
+            return np.clip(compiled_model.predict(input_features.to_numpy(dtype=float)), 0, 10)
+
+        if model_package['scaler'] is not None:
+            input_features = model_package['scaler'].transform(input_features)
+
+        predictions = model_package['model'].predict(input_features)
+        return np.clip(np.asarray(predictions, dtype=float), 0, 10)
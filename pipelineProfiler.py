@@ -0,0 +1,142 @@
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def _current_rss():
+    """Resident set size of this process in bytes, or None where it cannot be read cheaply"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _lifetime_peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _mb(value):
+    return None if value is None else round(value / (1024 * 1024), 2)
+
+class PipelineProfiler:
+    """Wall time, CPU time and peak RSS of each named pipeline stage, written as a JSON run report.
+
+    `stage(name)` is a context manager; stages may nest and are reported as
+    "outer/inner". CPU time is this process's own (fits running in joblib
+    workers show up in the per-model timings added with `record`, not here).
+    Peak RSS is sampled every `sample_interval` seconds by a background thread
+    while any stage is open. The stage named `profile_stage` also runs under
+    cProfile; its stats are saved next to the report. A profiler created with
+    `enabled=False` records nothing, so callers can always use `stage`.
+    """
+
+    def __init__(self, enabled=True, profile_stage=None, sample_interval=0.01, top_functions=25):
+        self.enabled = enabled
+        self.profile_stage = profile_stage
+        self.sample_interval = sample_interval
+        self.top_functions = top_functions
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.stages = []
+        self.sections = {}
+        self._open = []
+        self._lock = threading.Lock()
+        self._sampler = None
+        self._profile = None
+
+    def _sample(self):
+        while True:
+            with self._lock:
+                if not self._open:
+                    self._sampler = None
+                    return
+                rss = _current_rss()
+                for record in self._open:
+                    record['peak_rss'] = max(record['peak_rss'], rss or 0)
+            time.sleep(self.sample_interval)
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        rss = _current_rss()
+        with self._lock:
+            path = f"{self._open[-1]['name']}/{name}" if self._open else name
+            record = {'name': path, 'rss_start': rss, 'peak_rss': rss or 0}
+            self._open.append(record)
+            if self._sampler is None and rss is not None:
+                self._sampler = threading.Thread(target=self._sample, name="pipeline-profiler", daemon=True)
+                self._sampler.start()
+        profile = cProfile.Profile() if self.profile_stage in (name, path) and self._profile is None else None
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+                self._profile = (path, profile)
+            wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            rss = _current_rss()
+            with self._lock:
+                self._open.remove(record)
+            self.stages.append({
+                'name': path,
+                'wall_s': round(wall, 4),
+                'cpu_s': round(cpu, 4),
+                'rss_start_mb': _mb(record['rss_start']),
+                'rss_end_mb': _mb(rss),
+                'peak_rss_mb': _mb(max(record['peak_rss'], rss or 0)) if rss is not None else None
+            })
+
+    def record(self, section, data):
+        """Attach extra machine-readable data (run settings, per-model timings) to the report"""
+        if self.enabled:
+            self.sections[section] = data
+
+    def report(self):
+        return {
+            'started_at': self.started_at.isoformat(),
+            'total_wall_s': round(time.perf_counter() - self._start, 4),
+            'lifetime_peak_rss_mb': _mb(_lifetime_peak_rss()),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'argv': sys.argv,
+            'stages': self.stages,
+            **self.sections
+        }
+
+    def write_report(self, path):
+        """Write the JSON report (and the cProfile stats of `profile_stage`, if it ran) and return its path"""
+        if not self.enabled:
+            return None
+        report = self.report()
+        if self._profile is not None:
+            stage_name, profile = self._profile
+            stats_path = f"{os.path.splitext(path)[0]}.{stage_name.replace('/', '.')}.prof"
+            profile.dump_stats(stats_path)
+            summary = io.StringIO()
+            pstats.Stats(profile, stream=summary).sort_stats('cumulative').print_stats(self.top_functions)
+            report['profile'] = {'stage': stage_name, 'stats_file': stats_path,
+                                 'top_cumulative': summary.getvalue().splitlines()}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=float)
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,226 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+
+from compiledForest import CompiledForest
+
+class LinearModel:
+    """Linear regression evaluated from its coefficient array"""
+
+    def __init__(self, coef, intercept):
+        self.coef = coef
+        self.intercept = float(intercept)
+
+    def predict(self, X):
+        return np.asarray(X, dtype=float) @ self.coef + self.intercept
+
+class RBFKernelModel:
+    """RBF-kernel SVR evaluated from its support vectors and dual coefficients"""
+
+    def __init__(self, support_vectors, dual_coef, intercept, gamma):
+        self.support_vectors = support_vectors
+        self.dual_coef = dual_coef
+        self.intercept = float(intercept)
+        self.gamma = float(gamma)
+        self._support_norms = np.einsum('ij,ij->i', support_vectors, support_vectors)
+
+    def predict(self, X):
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        distances = np.einsum('ij,ij->i', X, X)[:, None] + self._support_norms - 2 * X @ self.support_vectors.T
+        return np.exp(-self.gamma * np.maximum(distances, 0)) @ self.dual_coef + self.intercept
+
+class StandardScalerArrays:
+    """StandardScaler.transform from the fitted mean and scale arrays"""
+
+    def __init__(self, mean, scale):
+        self.mean = mean
+        self.scale = scale
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=float) - self.mean) / self.scale
+
+class LazyJoblibModel:
+    """Estimator kept as a joblib file in the export and unpickled on its first predict call"""
+
+    def __init__(self, path):
+        self.path = path
+        self._model = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    import joblib
+                    self._model = joblib.load(self.path)
+        return self._model
+
+    def predict(self, X):
+        return self.load().predict(X)
+
+class PortableModel:
+    """Model package stored as a JSON manifest plus .npy arrays, loadable without scikit-learn.
+
+    Linear models, RBF SVRs and tree ensembles (as CompiledForest arrays) are
+    exported natively; any other model is kept as a joblib file inside the
+    directory and unpickled on load. Tree ensembles also keep the fitted
+    estimator as a joblib file, loaded lazily as the package's 'model': the
+    CompiledForest serves single rows and small batches without scikit-learn,
+    while large batches still get sklearn's compiled traversal (see
+    ModelHandler.COMPILED_BATCH_MAX_ROWS).
+    """
+
+    FORMAT_VERSION = 1
+    MANIFEST = "manifest.json"
+    FOREST_ARRAYS = ['feature', 'threshold', 'left', 'right', 'value', 'roots']
+
+    @staticmethod
+    def file_sha256(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def export(model_package, directory, source_file=None):
+        """Write `model_package` into `directory`, replacing any previous export.
+
+        `source_file` is the joblib package it was exported from; its hash is
+        recorded so `matches_source` can tell when the export has gone stale.
+        """
+        tmp_directory = f"{directory}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+        os.makedirs(tmp_directory)
+
+        def save(name, array):
+            np.save(os.path.join(tmp_directory, f"{name}.npy"), np.ascontiguousarray(array))
+            return f"{name}.npy"
+
+        model = model_package['model']
+        model_type = type(model).__name__
+        if model_type in ('LinearRegression', 'Ridge', 'SGDRegressor'):
+            model_entry = {'kind': 'linear', 'intercept': float(np.ravel(model.intercept_)[0]),
+                           'arrays': {'coef': save('coef', np.ravel(model.coef_))}}
+        elif model_type == 'SVR' and model.kernel == 'rbf':
+            model_entry = {'kind': 'svr_rbf', 'intercept': float(model.intercept_[0]), 'gamma': float(model._gamma),
+                           'arrays': {'support_vectors': save('support_vectors', model.support_vectors_),
+                                      'dual_coef': save('dual_coef', model.dual_coef_[0])}}
+        elif CompiledForest.supports(model):
+            forest = model_package.get('compiled_model') or CompiledForest.from_estimator(model)
+            import joblib
+            joblib.dump(model, os.path.join(tmp_directory, "model.joblib"))
+            model_entry = {'kind': 'forest', 'offset': forest.offset, 'scale': forest.scale,
+                           'max_depth': forest.max_depth, 'input_dtype': forest.input_dtype.name,
+                           'estimator_file': "model.joblib",
+                           'arrays': {name: save(f"forest_{name}", getattr(forest, name))
+                                      for name in PortableModel.FOREST_ARRAYS}}
+        else:
+            import joblib
+            joblib.dump(model, os.path.join(tmp_directory, "model.joblib"))
+            model_entry = {'kind': 'joblib', 'file': "model.joblib"}
+
+        scaler = model_package.get('scaler')
+        manifest = {
+            'format_version': PortableModel.FORMAT_VERSION,
+            'model_name': model_package['model_name'],
+            'model_type': model_type,
+            'model': model_entry,
+            'scaler': None if scaler is None else {'mean': save('scaler_mean', scaler.mean_),
+                                                   'scale': save('scaler_scale', scaler.scale_)},
+            'feature_names': list(model_package['feature_names']),
+            'category_lookups': {
+                name: {'classes': [str(value) for value in lookup['classes']], 'fallback': int(lookup['fallback'])}
+                for name, lookup in model_package['category_lookups'].items()
+            },
+            'selection': model_package.get('selection'),
+            'source_sha256': PortableModel.file_sha256(source_file) if source_file else None
+        }
+        with open(os.path.join(tmp_directory, PortableModel.MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, default=float)
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_directory, directory)
+        return directory
+
+    @staticmethod
+    def is_export(path):
+        return os.path.isfile(os.path.join(path, PortableModel.MANIFEST))
+
+    @staticmethod
+    def matches_source(directory, source_file):
+        """Whether the export in `directory` was made from the current contents of `source_file`"""
+        with open(os.path.join(directory, PortableModel.MANIFEST), "r", encoding="utf-8") as f:
+            recorded = json.load(f).get('source_sha256')
+        return recorded is not None and recorded == PortableModel.file_sha256(source_file)
+
+    @staticmethod
+    def load(directory, mmap=True):
+        """Load an exported package with the same keys as the joblib model package"""
+        with open(os.path.join(directory, PortableModel.MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest['format_version'] != PortableModel.FORMAT_VERSION:
+            raise ValueError(f"Unsupported model export format {manifest['format_version']}")
+
+        def load_array(file_name):
+            return np.load(os.path.join(directory, file_name), mmap_mode='r' if mmap else None)
+
+        entry = manifest['model']
+        arrays = {name: load_array(file_name) for name, file_name in entry.get('arrays', {}).items()}
+        compiled_model = None
+        if entry['kind'] == 'linear':
+            model = LinearModel(arrays['coef'], entry['intercept'])
+        elif entry['kind'] == 'svr_rbf':
+            model = RBFKernelModel(arrays['support_vectors'], arrays['dual_coef'], entry['intercept'], entry['gamma'])
+        elif entry['kind'] == 'forest':
+            model = compiled_model = CompiledForest(offset=entry['offset'], scale=entry['scale'],
+                                                    max_depth=entry['max_depth'], input_dtype=entry['input_dtype'],
+                                                    **arrays)
+            if entry.get('estimator_file'):
+                model = LazyJoblibModel(os.path.join(directory, entry['estimator_file']))
+        elif entry['kind'] == 'joblib':
+            import joblib
+            model = joblib.load(os.path.join(directory, entry['file']))
+        else:
+            raise ValueError(f"Unknown model kind '{entry['kind']}'")
+
+        scaler = manifest['scaler']
+        return {
+            'model': model,
+            'model_name': manifest['model_name'],
+            'compiled_model': compiled_model,
+            'scaler': None if scaler is None else StandardScalerArrays(load_array(scaler['mean']),
+                                                                       load_array(scaler['scale'])),
+            'encoders': None,
+            'category_lookups': {
+                name: {'codes': {value: code for code, value in enumerate(lookup['classes'])},
+                       'classes': lookup['classes'], 'fallback': lookup['fallback']}
+                for name, lookup in manifest['category_lookups'].items()
+            },
+            'selection': manifest['selection'],
+            'feature_names': manifest['feature_names']
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a joblib model package to the portable format")
+    parser.add_argument("model_file", help="Path to a joblib model package, e.g. best_addiction_model.pkl")
+    parser.add_argument("directory", help="Output directory, e.g. best_addiction_model")
+    args = parser.parse_args()
+
+    import joblib
+    from featureSchema import CategoryLookup
+    model_package = joblib.load(args.model_file)
+    if 'category_lookups' not in model_package:
+        model_package['category_lookups'] = CategoryLookup.build(model_package['encoders'])
+    PortableModel.export(model_package, args.directory, source_file=args.model_file)
+    exported = PortableModel.load(args.directory)
+    print(f"Exported '{model_package['model_name']}' to '{args.directory}' "
+          f"({type(exported.get('compiled_model') or exported['model']).__name__} at serve time)")
+
+if __name__ == "__main__":
+    main()
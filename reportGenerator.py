@@ -0,0 +1,174 @@
+from config import Config
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+class ReportStore:
+    """Rendered PDF bytes keyed by report id, optionally mirrored to a bounded directory.
+
+    The in-memory store is an LRU of `max_entries` reports. When `directory` is
+    set every report is also written there as report_<id>.pdf; the oldest files
+    are evicted once the directory exceeds `max_disk_bytes` or a file is older
+    than `max_age_seconds`.
+    """
+
+    def __init__(self, max_entries=128, directory=None, max_disk_bytes=200 * 1024 * 1024, max_age_seconds=7 * 24 * 3600):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age_seconds = max_age_seconds
+        self._reports = OrderedDict()
+        self._disk_index = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._index_directory()
+
+    def path_for(self, report_id):
+        return os.path.join(self.directory, f"report_{report_id}.pdf")
+
+    def put(self, report_id, data):
+        with self._lock:
+            self._reports[report_id] = data
+            self._reports.move_to_end(report_id)
+            while len(self._reports) > self.max_entries:
+                self._reports.popitem(last=False)
+            if self.directory:
+                path = self.path_for(report_id)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                self._disk_index.pop(report_id, None)
+                self._disk_index[report_id] = (time.time(), len(data))
+                self._evict_disk()
+
+    def get(self, report_id):
+        """Return the report bytes, or None if the report is unknown or evicted"""
+        with self._lock:
+            data = self._reports.get(report_id)
+            if data is not None:
+                self._reports.move_to_end(report_id)
+                return data
+            if report_id not in self._disk_index:
+                return None
+            created, _ = self._disk_index[report_id]
+            if time.time() - created > self.max_age_seconds:
+                self._evict_disk()
+                return None
+            try:
+                with open(self.path_for(report_id), "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                self._disk_index.pop(report_id, None)
+                return None
+
+    def __contains__(self, report_id):
+        with self._lock:
+            return report_id in self._reports or report_id in self._disk_index
+
+    def _index_directory(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.startswith("report_") and entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[len("report_"):-len(".pdf")], stat.st_size))
+        for created, report_id, size in sorted(entries):
+            self._disk_index[report_id] = (created, size)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        now = time.time()
+        total_bytes = sum(size for _, size in self._disk_index.values())
+        while self._disk_index:
+            report_id, (created, size) = next(iter(self._disk_index.items()))
+            if total_bytes <= self.max_disk_bytes and now - created <= self.max_age_seconds:
+                break
+            del self._disk_index[report_id]
+            total_bytes -= size
+            try:
+                os.remove(self.path_for(report_id))
+            except FileNotFoundError:
+                pass
+
+
+class PDFGenerator:
+    store = ReportStore(
+        max_entries=Config.REPORT_STORE_SIZE,
+        directory=Config.REPORT_DIR,
+        max_disk_bytes=Config.REPORT_DIR_MAX_BYTES,
+        max_age_seconds=Config.REPORT_MAX_AGE
+    )
+
+    @staticmethod
+    def generate_report(user_input, prediction_score, addiction_level, ai_response, report_id=None):
+        """Render a report into PDFGenerator.store and return its report id"""
+        report_id = report_id or uuid.uuid4().hex
+        data = PDFGenerator.render_report(user_input, prediction_score, addiction_level, ai_response)
+        PDFGenerator.store.put(report_id, data)
+        return report_id
+
+    @staticmethod
+    def render_report(user_input, prediction_score, addiction_level, ai_response):
+        """Render a report to PDF bytes in memory"""
+        from reportTemplate import ReportTemplate
+        pdf = ReportTemplate.new_document()
+
+        pdf.set_font(ReportTemplate.FONT_FAMILY, "", 12)
+        pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
+        pdf.ln(10)
+
+        ReportTemplate.section(pdf, "User Profile")
+        for key, value in user_input.items():
+            pdf.cell(0, 8, f"{key.replace('_', ' ')}: {value}", ln=True)
+        pdf.ln(5)
+
+        ReportTemplate.section(pdf, "Prediction Results")
+        pdf.cell(0, 8, f"Addiction Score: {prediction_score:.1f}/10", ln=True)
+        pdf.cell(0, 8, f"Addiction Level: {addiction_level}", ln=True)
+        pdf.ln(5)
+
+        ReportTemplate.section(pdf, "AI Personalized Analysis")
+        for line in ai_response.split("\n"):
+            pdf.multi_cell(0, 8, line)
+
+        return pdf.output(dest='S').encode("latin1")
+
+
+class ReportWorker:
+    """Background queue that renders PDF reports off the request path.
+
+    Jobs are identified by a caller-supplied id so submitting the same report
+    twice (e.g. from a Streamlit rerun) returns the existing job.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=Config.REPORT_WORKERS, thread_name_prefix="report")
+    _jobs = {}
+    _jobs_lock = threading.Lock()
+
+    @staticmethod
+    def submit(job_id, user_input, prediction_score, addiction_level, ai_response):
+        """Queue a report and return its job handle, a Future resolving to the report id.
+
+        The report is stored in PDFGenerator.store under `job_id`; it is rendered
+        again if an earlier attempt failed or the stored copy has been evicted.
+        """
+        with ReportWorker._jobs_lock:
+            job = ReportWorker._jobs.get(job_id)
+            if job is not None and job.done() and (job.exception() is not None or job_id not in PDFGenerator.store):
+                job = None
+            if job is None:
+                job = ReportWorker._executor.submit(
+                    PDFGenerator.generate_report, dict(user_input), prediction_score, addiction_level, ai_response, job_id
+                )
+                ReportWorker._jobs[job_id] = job
+            while len(ReportWorker._jobs) > Config.REPORT_JOB_HISTORY:
+                oldest_id = next(iter(ReportWorker._jobs))
+                if not ReportWorker._jobs[oldest_id].done():
+                    break
+                del ReportWorker._jobs[oldest_id]
+            return job
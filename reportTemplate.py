@@ -0,0 +1,114 @@
+from fpdf import FPDF
+import fpdf.fpdf
+from fpdf.ttfonts import TTFontFile
+import copy
+import os
+import threading
+from collections import OrderedDict
+
+class SubsetCachingTTFontFile(TTFontFile):
+    """TTFontFile that reuses embedded font subsets built for an identical set of characters.
+
+    Building the subset re-parses the TTF file and dominates report rendering.
+    Subsets are kept in a small per-process LRU keyed by font file and the
+    sorted set of characters the document uses, so a cached stream is exactly
+    the one TTFontFile would build and embeds only those glyphs. `hits` and
+    `misses` count lookups since the process started (or the last `clear`).
+    """
+
+    max_entries = 32
+    hits = 0
+    misses = 0
+    _subsets = OrderedDict()
+    _lock = threading.Lock()
+
+    def makeSubset(self, file, subset):
+        codes = tuple(sorted(set(subset)))
+        key = (file, codes)
+        with SubsetCachingTTFontFile._lock:
+            cached = SubsetCachingTTFontFile._subsets.get(key)
+            if cached is not None:
+                SubsetCachingTTFontFile._subsets.move_to_end(key)
+                SubsetCachingTTFontFile.hits += 1
+            else:
+                SubsetCachingTTFontFile.misses += 1
+        if cached is not None:
+            stream, self.codeToGlyph, self.maxUni = cached
+            return stream
+        stream = super().makeSubset(file, list(codes))
+        with SubsetCachingTTFontFile._lock:
+            SubsetCachingTTFontFile._subsets[key] = (stream, self.codeToGlyph, self.maxUni)
+            while len(SubsetCachingTTFontFile._subsets) > SubsetCachingTTFontFile.max_entries:
+                SubsetCachingTTFontFile._subsets.popitem(last=False)
+        return stream
+
+    @staticmethod
+    def clear():
+        with SubsetCachingTTFontFile._lock:
+            SubsetCachingTTFontFile._subsets.clear()
+            SubsetCachingTTFontFile.hits = SubsetCachingTTFontFile.misses = 0
+
+class ReportPDF(FPDF):
+    """FPDF that embeds its fonts through SubsetCachingTTFontFile.
+
+    FPDF 1.7 builds font subsets in _putfonts via the module-level name
+    fpdf.fpdf.TTFontFile, so only that call swaps it, under a lock, and puts
+    the original back. Other FPDF documents keep the stock subsetter; one that
+    happens to embed fonts during the swap still gets byte-identical output.
+    """
+
+    _putfonts_lock = threading.Lock()
+
+    def _putfonts(self):
+        with ReportPDF._putfonts_lock:
+            original = fpdf.fpdf.TTFontFile
+            fpdf.fpdf.TTFontFile = SubsetCachingTTFontFile
+            try:
+                super()._putfonts()
+            finally:
+                fpdf.fpdf.TTFontFile = original
+
+class ReportTemplate:
+    """Per-process report skeleton reused by every PDF report.
+
+    The DejaVu font metrics are loaded once and the page setup and title are
+    laid out once; each report starts from a copy of that skeleton that shares
+    the read-only glyph width table and only fills in the per-user fields.
+    """
+
+    FONT_FAMILY = "DejaVu"
+    FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts", "DejaVuSans.ttf")
+    TITLE = "Social Media Addiction Analysis Report"
+
+    _skeleton = None
+    _shared = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _build_skeleton():
+        pdf = ReportPDF()
+        pdf.add_page()
+        pdf.set_auto_page_break(auto=True, margin=15)
+        pdf.add_font(ReportTemplate.FONT_FAMILY, "", ReportTemplate.FONT_PATH, uni=True)
+        # The bundled metrics cache (fonts/DejaVuSans.pkl) stores a cwd-relative TTF path
+        pdf.fonts[ReportTemplate.FONT_FAMILY.lower()]['ttffile'] = ReportTemplate.FONT_PATH
+
+        pdf.set_font(ReportTemplate.FONT_FAMILY, "", 16)
+        pdf.cell(0, 10, ReportTemplate.TITLE, ln=True, align='C')
+        return pdf
+
+    @staticmethod
+    def new_document():
+        """Return a fresh FPDF positioned right below the report title"""
+        with ReportTemplate._lock:
+            if ReportTemplate._skeleton is None:
+                ReportTemplate._skeleton = ReportTemplate._build_skeleton()
+                font = ReportTemplate._skeleton.fonts[ReportTemplate.FONT_FAMILY.lower()]
+                ReportTemplate._shared = {id(font['cw']): font['cw'], id(font['desc']): font['desc']}
+        return copy.deepcopy(ReportTemplate._skeleton, dict(ReportTemplate._shared))
+
+    @staticmethod
+    def section(pdf, title):
+        pdf.set_font(ReportTemplate.FONT_FAMILY, "", 14)
+        pdf.cell(0, 10, title, ln=True)
+        pdf.set_font(ReportTemplate.FONT_FAMILY, "", 12)
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+class ResponseCache:
+    """Thread-safe LRU cache with TTL for LLM responses, optionally persisted to a JSON file"""
+
+    def __init__(self, max_entries=256, ttl_seconds=3600, persist_path=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persist_path = persist_path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if persist_path:
+            self._load()
+
+    @staticmethod
+    def make_key(*parts):
+        """Canonical SHA-256 key over JSON-serializable parts (dict key order does not matter)"""
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._is_expired(entry):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry['value']
+
+    def set(self, key, value):
+        """Store a JSON-serializable value, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = {'value': value, 'created': time.time()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.persist_path:
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self.persist_path:
+                self._save()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _is_expired(self, entry):
+        return self.ttl_seconds is not None and time.time() - entry['created'] > self.ttl_seconds
+
+    def _load(self):
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        for key, entry in stored:
+            if not self._is_expired(entry):
+                self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self):
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.persist_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(list(self._entries.items()), f)
+        os.replace(tmp_path, self.persist_path)
@@ -0,0 +1,152 @@
+import argparse
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from config import Config
+from featureSchema import CATEGORICAL_ENCODERS, FEATURE_COLUMNS, NUMERIC_COLUMNS
+from modelHandler import ModelHandler
+from AnalyzeAddiction import AddictionAnalyzer
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that hands each connection to a fixed-size worker pool"""
+
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, model_package, workers):
+        super().__init__(server_address, handler_class)
+        self.model_package = model_package
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scoring")
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints for single and batch addiction score predictions.
+
+    Every response closes its connection, so a pooled worker is released as
+    soon as it has answered; idle keep-alive clients cannot hold pool slots.
+    `timeout` bounds how long a client may take to send its request.
+    """
+
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+
+    def do_GET(self):
+        start = time.perf_counter()
+        if self.path == "/health":
+            self.send_json(200, {'status': 'ok', 'model': self.server.model_package['model_name']}, start)
+        else:
+            self.send_json(404, {'error': f"Unknown path '{self.path}'"}, start)
+
+    def do_POST(self):
+        start = time.perf_counter()
+        try:
+            payload = self.read_json()
+            if self.path == "/predict":
+                self.send_json(200, self.score_single(payload), start)
+            elif self.path == "/predict/batch":
+                self.send_json(200, self.score_batch(payload), start)
+            else:
+                self.send_json(404, {'error': f"Unknown path '{self.path}'"}, start)
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_json(400, {'error': str(e)}, start)
+        except Exception as e:
+            self.send_json(500, {'error': f"Prediction error: {str(e)}"}, start)
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        try:
+            return json.loads(body or b"null")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON body: {e}")
+
+    @staticmethod
+    def validate_record(record):
+        if not isinstance(record, dict):
+            raise ValueError("Each record must be a JSON object")
+        missing = [name for name in FEATURE_COLUMNS if name not in record]
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}")
+        for name in NUMERIC_COLUMNS:
+            value = record[name]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                raise ValueError(f"Field '{name}' must be a finite number, got {json.dumps(value)}")
+        for name in CATEGORICAL_ENCODERS:
+            if not isinstance(record[name], str):
+                raise ValueError(f"Field '{name}' must be a string, got {json.dumps(record[name])}")
+
+    def score_single(self, payload):
+        self.validate_record(payload)
+        prediction = float(ModelHandler.predict_batch(self.server.model_package, [payload])[0])
+        level, _, _ = AddictionAnalyzer.get_addiction_level(prediction)
+        return {'prediction': prediction, 'addiction_level': level}
+
+    def score_batch(self, payload):
+        records = payload.get('records') if isinstance(payload, dict) else payload
+        if not isinstance(records, list):
+            raise ValueError("Expected a list of records or {\"records\": [...]}")
+        for record in records:
+            self.validate_record(record)
+        predictions = ModelHandler.predict_batch(self.server.model_package, records)
+        return {'predictions': predictions.tolist(), 'count': len(records)}
+
+    def send_json(self, status, body, start):
+        latency_ms = (time.perf_counter() - start) * 1000
+        body['latency_ms'] = round(latency_ms, 3)
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("X-Latency-Ms", f"{latency_ms:.3f}")
+        self.send_header("Connection", "close")
+        self.close_connection = True
+        self.end_headers()
+        self.wfile.write(data)
+        self.log_message('"%s" %s %.3fms', self.requestline, status, latency_ms)
+
+    def log_request(self, code='-', size='-'):
+        """Requests are logged with their latency by send_json"""
+
+def create_server(host=Config.SCORING_HOST, port=Config.SCORING_PORT,
+                  workers=Config.SCORING_WORKERS, model_file=None):
+    """Load the model package once and build a server bound to host:port"""
+    model_package = ModelHandler.read_model_package(model_file)
+    return PooledHTTPServer((host, port), ScoringRequestHandler, model_package, workers)
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless scoring service for the addiction model")
+    parser.add_argument("--host", default=Config.SCORING_HOST)
+    parser.add_argument("--port", type=int, default=Config.SCORING_PORT)
+    parser.add_argument("--workers", type=int, default=Config.SCORING_WORKERS)
+    parser.add_argument("--model", default=None,
+                        help="Model package or portable export directory (default: the export when present)")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.workers, args.model)
+    print(f"Serving '{server.model_package['model_name']}' on http://{args.host}:{args.port} "
+          f"with {args.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
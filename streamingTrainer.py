@@ -0,0 +1,66 @@
+from collections import Counter
+
+import numpy as np
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from featureSchema import CATEGORICAL_ENCODERS, FEATURE_COLUMNS, TARGET_COLUMN, CategoryLookup, read_dataset_chunks
+
+class StreamingDataset:
+    """Chunked, re-readable view of the training CSV for out-of-core training.
+
+    Only one chunk of `chunk_size` rows is in memory at a time. Every pass
+    re-reads the file and assigns rows to the holdout set with the same seeded
+    random draw, so the train/test split is identical across passes. The
+    category vocabularies and the scaler are built incrementally by
+    `build_vocabularies` and `fit_scaler` before the encoded chunks are used.
+    """
+
+    def __init__(self, file_path, chunk_size=10000, test_size=0.2, random_state=42):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.test_size = test_size
+        self.random_state = random_state
+        self.encoders = None
+        self.category_lookups = None
+        self.scaler = None
+        self.n_train = 0
+
+    def build_vocabularies(self):
+        """One pass counting categories; builds LabelEncoder-compatible encoders and lookup tables"""
+        counts = {column: Counter() for column in CATEGORICAL_ENCODERS}
+        for chunk in read_dataset_chunks(self.file_path, self.chunk_size):
+            for column in CATEGORICAL_ENCODERS:
+                counts[column].update(chunk[column].value_counts().to_dict())
+
+        self.encoders = {}
+        for column, encoder_name in CATEGORICAL_ENCODERS.items():
+            encoder = LabelEncoder()
+            encoder.classes_ = np.array(sorted(counts[column]), dtype=object)
+            self.encoders[encoder_name] = encoder
+        self.category_lookups = CategoryLookup.build(self.encoders)
+        for column, encoder_name in CATEGORICAL_ENCODERS.items():
+            lookup = self.category_lookups[encoder_name]
+            lookup['fallback'] = lookup['codes'][counts[column].most_common(1)[0][0]]
+        return self.encoders
+
+    def chunks(self, split):
+        """Yield encoded (X, y) float arrays for the 'train' or 'test' rows of each chunk"""
+        rng = np.random.default_rng(self.random_state)
+        for chunk in read_dataset_chunks(self.file_path, self.chunk_size):
+            is_test = rng.random(len(chunk)) < self.test_size
+            rows = chunk[is_test] if split == 'test' else chunk[~is_test]
+            if not len(rows):
+                continue
+            X = rows[FEATURE_COLUMNS].copy()
+            for column, encoder_name in CATEGORICAL_ENCODERS.items():
+                X[column] = CategoryLookup.encode_column(self.category_lookups[encoder_name], X[column])
+            yield X.to_numpy(dtype=float), rows[TARGET_COLUMN].to_numpy(dtype=float)
+
+    def fit_scaler(self):
+        """One pass over the training rows accumulating running mean and variance"""
+        self.scaler = StandardScaler()
+        self.n_train = 0
+        for X, _ in self.chunks('train'):
+            self.scaler.partial_fit(X)
+            self.n_train += len(X)
+        return self.scaler
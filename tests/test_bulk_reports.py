@@ -0,0 +1,38 @@
+import csv
+import os
+
+from bulkReports import export_reports
+from featureSchema import read_dataset
+from Gemini_integration import GeminiAI
+from modelHandler import ModelHandler
+from responseCache import ResponseCache
+
+MODEL_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "best_addiction_model.pkl")
+
+HEADER = ("Age,Gender,Academic_Level,Country,Avg_Daily_Usage_Hours,Most_Used_Platform,"
+          "Affects_Academic_Performance,Sleep_Hours_Per_Night,Mental_Health_Score,"
+          "Conflicts_Over_Social_Media,Addicted_Score\n")
+
+# The same profile as the UI builds it from the form widgets
+UI_INPUT = {
+    'Age': 20, 'Gender': 'Female', 'Academic_Level': 'Undergraduate', 'Country': 'India',
+    'Avg_Daily_Usage_Hours': 5.2, 'Most_Used_Platform': 'Instagram', 'Affects_Academic_Performance': 'Yes',
+    'Sleep_Hours_Per_Night': 6.1, 'Mental_Health_Score': 6, 'Conflicts_Over_Social_Media': 3
+}
+
+def test_exported_record_keeps_decimal_values_and_matches_ui_cache(tmp_path, monkeypatch):
+    csv_path = tmp_path / "cohort.csv"
+    csv_path.write_text(HEADER + "20,Female,Undergraduate,India,5.2,Instagram,Yes,6.1,6,3,7\n")
+    model_package = ModelHandler.read_model_package(MODEL_FILE)
+    score = float(ModelHandler.predict_batch(model_package, read_dataset(str(csv_path)))[0])
+
+    cache = ResponseCache()
+    cache.set(GeminiAI.make_cache_key("analysis", UI_INPUT, score), {'text': "Cached analysis"})
+    monkeypatch.setattr(GeminiAI, "cache", cache)
+
+    output = tmp_path / "reports"
+    export_reports(str(csv_path), str(output), workers=1, ai_text="cache", model_file=MODEL_FILE)
+
+    with open(output / "manifest.csv", newline="") as f:
+        manifest = list(csv.DictReader(f))
+    assert [row['analysis_source'] for row in manifest] == ["cache"]
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from featureSchema import DATASET_DTYPES, feature_records, read_dataset
+
+HEADER = ("Age,Gender,Academic_Level,Country,Avg_Daily_Usage_Hours,Most_Used_Platform,"
+          "Affects_Academic_Performance,Sleep_Hours_Per_Night,Mental_Health_Score,"
+          "Conflicts_Over_Social_Media,Addicted_Score\n")
+
+def write_csv(tmp_path, rows):
+    path = tmp_path / "students.csv"
+    path.write_text(HEADER + "".join(row + "\n" for row in rows))
+    return str(path)
+
+def row(age="20", mental_health="6"):
+    return f"{age},Female,Undergraduate,India,5.5,Instagram,Yes,6.5,{mental_health},3,7"
+
+def test_declared_dtypes(tmp_path):
+    df = read_dataset(write_csv(tmp_path, [row(), HEADER.strip(), row(age="22")]))
+    assert len(df) == 2
+    assert list(df['Age']) == [20, 22]
+    for column, dtype in DATASET_DTYPES.items():
+        assert str(df[column].dtype) == dtype
+
+@pytest.mark.parametrize("age, mental_health, column", [
+    ("200", "6", "Age"), ("-200", "6", "Age"), ("20", "8.7", "Mental_Health_Score")
+])
+def test_out_of_range_or_fractional_values_raise(tmp_path, age, mental_health, column):
+    with pytest.raises(ValueError, match=column):
+        read_dataset(write_csv(tmp_path, [row(), row(age=age, mental_health=mental_health)]))
+
+def test_whole_float_values_are_accepted(tmp_path):
+    df = read_dataset(write_csv(tmp_path, [row(mental_health="8.0")]))
+    assert df['Mental_Health_Score'].iloc[0] == np.int8(8)
+
+def test_feature_records_keep_decimal_values(tmp_path):
+    path = write_csv(tmp_path, ["20,Female,Undergraduate,India,5.2,Instagram,Yes,6.1,6,3,7"])
+    record = feature_records(read_dataset(path))[0]
+    assert record['Avg_Daily_Usage_Hours'] == 5.2 and record['Sleep_Hours_Per_Night'] == 6.1
+    assert type(record['Age']) is int and type(record['Avg_Daily_Usage_Hours']) is float
@@ -0,0 +1,18 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from bench_importtime import LAZY_MODULES
+
+@pytest.mark.parametrize("module", ["app", "modelHandler", "scoringServer"])
+def test_import_does_not_load_lazy_dependencies(module):
+    script = (f"import json, sys\nimport {module}\n"
+              f"print(json.dumps([name for name in {LAZY_MODULES!r} if name in sys.modules]))")
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert json.loads(output.stdout.strip().splitlines()[-1]) == []
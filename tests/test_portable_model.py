@@ -0,0 +1,51 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+
+from compiledForest import CompiledForest
+from config import Config
+from modelHandler import ModelHandler
+from portableModel import LazyJoblibModel, PortableModel
+
+@pytest.fixture
+def exported(tmp_path, monkeypatch):
+    """A forest package dumped as a .pkl in tmp_path and exported next to it"""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.preprocessing import LabelEncoder
+    from featureSchema import CATEGORICAL_ENCODERS, FEATURE_COLUMNS, CategoryLookup
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 10, (200, len(FEATURE_COLUMNS)))
+    model = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, X[:, 0])
+    encoders = {}
+    for encoder_name in CATEGORICAL_ENCODERS.values():
+        encoders[encoder_name] = LabelEncoder().fit([f"{encoder_name}{i}" for i in range(3)])
+    package = {'model': model, 'model_name': 'Random Forest', 'compiled_model': CompiledForest.from_estimator(model),
+               'scaler': None, 'encoders': encoders, 'category_lookups': CategoryLookup.build(encoders),
+               'selection': None, 'feature_names': FEATURE_COLUMNS}
+    model_file, model_dir = str(tmp_path / "model.pkl"), str(tmp_path / "model")
+    joblib.dump(package, model_file)
+    PortableModel.export(package, model_dir, source_file=model_file)
+    monkeypatch.setattr(Config, "MODEL_FILE", model_file)
+    monkeypatch.setattr(Config, "MODEL_DIR", model_dir)
+    return package, model_file, model_dir
+
+def test_current_export_is_preferred(exported):
+    _, _, model_dir = exported
+    assert ModelHandler.default_model_path() == model_dir
+
+def test_stale_export_falls_back_to_pkl(exported):
+    package, model_file, _ = exported
+    joblib.dump({**package, 'model_name': 'Retrained'}, model_file)
+    with pytest.warns(RuntimeWarning, match="not made from the current"):
+        assert ModelHandler.default_model_path() == model_file
+
+def test_forest_export_keeps_sklearn_for_large_batches(exported):
+    package, _, model_dir = exported
+    loaded = PortableModel.load(model_dir)
+    assert isinstance(loaded['compiled_model'], CompiledForest)
+    assert isinstance(loaded['model'], LazyJoblibModel)
+    X = np.random.default_rng(1).uniform(0, 10, (50, len(package['feature_names'])))
+    np.testing.assert_allclose(loaded['model'].predict(X), package['model'].predict(X))
+    np.testing.assert_allclose(loaded['compiled_model'].predict(X), package['model'].predict(X))
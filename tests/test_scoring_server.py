@@ -0,0 +1,77 @@
+import http.client
+import json
+import os
+import threading
+
+import pytest
+
+from scoringServer import ScoringRequestHandler, create_server
+
+MODEL_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "best_addiction_model.pkl")
+
+VALID_RECORD = {
+    'Age': 20, 'Gender': 'Female', 'Academic_Level': 'Undergraduate', 'Country': 'India',
+    'Avg_Daily_Usage_Hours': 5.5, 'Most_Used_Platform': 'Instagram', 'Affects_Academic_Performance': 'Yes',
+    'Sleep_Hours_Per_Night': 6.5, 'Mental_Health_Score': 6, 'Conflicts_Over_Social_Media': 3
+}
+
+@pytest.fixture(scope="module")
+def server():
+    server = create_server("127.0.0.1", 0, workers=2, model_file=MODEL_FILE)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def request(server, method, path, body=None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    connection.request(method, path, body=None if body is None else json.dumps(body))
+    response = connection.getresponse()
+    result = response.status, response.getheader("Connection"), json.loads(response.read())
+    connection.close()
+    return result
+
+def test_valid_record_passes():
+    ScoringRequestHandler.validate_record(dict(VALID_RECORD))
+
+@pytest.mark.parametrize("field, value", [
+    ('Age', None), ('Age', "20"), ('Age', True), ('Age', float('nan')), ('Age', float('inf')),
+    ('Sleep_Hours_Per_Night', [6.5]), ('Gender', None), ('Country', 3), ('Most_Used_Platform', {'name': 'x'})
+])
+def test_invalid_values_are_rejected(field, value):
+    with pytest.raises(ValueError, match=field):
+        ScoringRequestHandler.validate_record({**VALID_RECORD, field: value})
+
+def test_missing_field_is_rejected():
+    record = dict(VALID_RECORD)
+    del record['Age']
+    with pytest.raises(ValueError, match="Missing fields: Age"):
+        ScoringRequestHandler.validate_record(record)
+
+def test_null_numeric_returns_400(server):
+    status, _, body = request(server, "POST", "/predict", {**VALID_RECORD, 'Age': None})
+    assert status == 400
+    assert "Age" in body['error']
+
+def test_batch_with_non_string_category_returns_400(server):
+    status, _, _ = request(server, "POST", "/predict/batch", [VALID_RECORD, {**VALID_RECORD, 'Gender': 1}])
+    assert status == 400
+
+def test_valid_prediction_closes_connection(server):
+    status, connection_header, body = request(server, "POST", "/predict", VALID_RECORD)
+    assert status == 200
+    assert 0 <= body['prediction'] <= 10
+    assert connection_header == "close"
+
+def test_idle_keep_alive_clients_do_not_starve_workers(server):
+    idle = []
+    for _ in range(2):
+        connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+        connection.request("GET", "/health")
+        connection.getresponse().read()
+        idle.append(connection)
+    status, _, _ = request(server, "GET", "/health")
+    assert status == 200
+    for connection in idle:
+        connection.close()
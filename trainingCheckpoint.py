@@ -0,0 +1,63 @@
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+class TrainingCheckpoint:
+    """Per-model training results on disk, keyed by the training data and the model configuration.
+
+    The data fingerprint is a SHA-256 over the train/test arrays, so a changed
+    CSV, split or preprocessing step invalidates every entry. Each model's key
+    adds its class, its full parameter set and the hyperparameter search
+    settings, so editing one candidate only retrains that candidate. Entries
+    are written atomically as `<model>-<key prefix>.joblib` and never deleted
+    automatically; remove the directory to start from scratch.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, directory, X_train, X_test, y_train, y_test):
+        self.directory = directory
+        digest = hashlib.sha256()
+        for array in (X_train, X_test, y_train, y_test):
+            array = np.ascontiguousarray(array, dtype=float)
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        self.data_hash = digest.hexdigest()
+
+    def key(self, name, model, search=None):
+        """Hash of the data fingerprint, the model's class and parameters and the search settings"""
+        import sklearn
+        config = {
+            'format_version': TrainingCheckpoint.FORMAT_VERSION,
+            'sklearn': sklearn.__version__,
+            'data': self.data_hash,
+            'name': name,
+            'class': f"{type(model).__module__}.{type(model).__qualname__}",
+            'params': model.get_params(deep=True),
+            'search': None if search is None else search.settings(name)
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=repr).encode()).hexdigest()
+
+    def _path(self, name, key):
+        return os.path.join(self.directory, f"{re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_')}-{key[:16]}.joblib")
+
+    def load(self, name, key):
+        """The saved entry for `name` under `key`, or None"""
+        import joblib
+        try:
+            entry = joblib.load(self._path(name, key))
+        except (FileNotFoundError, EOFError, ValueError):
+            return None
+        return entry if entry.get('key') == key else None
+
+    def save(self, name, key, entry):
+        import joblib
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(name, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        joblib.dump({**entry, 'key': key}, tmp_path)
+        os.replace(tmp_path, path)
+        return path
@@ -1,7 +1,7 @@
 import streamlit as st
+from config import Config
 from Gemini_integration import GeminiAI
-import os
-import pycountry
+from reportGenerator import PDFGenerator
 from ui import UIComponents
 from AnalyzeAddiction import ChartGenerator, AddictionAnalyzer 
 
@@ -10,6 +10,7 @@ class UserInputHandler:
     def collect_user_input():
         
         def get_country_list():
+            import pycountry
             return sorted([country.name for country in pycountry.countries])
         
         UIComponents.display_section_header("Personal Information")
@@ -86,80 +87,98 @@ class ResultsDisplayHandler:
                        use_container_width=True, config={'displayModeBar': False})
     
     @staticmethod
-    def display_ai_analysis(user_input, prediction):
-        st.markdown("---")
-        UIComponents.display_section_header("AI-Powered Analysis")
-        st.session_state["user_input"] = user_input
-        st.session_state["prediction"] = prediction
-        with st.spinner("AI is analyzing your profile..."):
-            ai_response, success = GeminiAI.query_gemini_api(user_input, prediction)
-        if success:
-            st.markdown(f"""
+    def render_ai_response(placeholder, ai_response):
+        ai_response_html = ai_response.replace('\n', '<br>')
+        placeholder.markdown(f"""
             <div class="ai-section">
                 <div class="ai-header">Personalized Analysis</div>
                 <div class="ai-response">
-                    {ai_response.replace('\n', '<br>')}
+                    {ai_response_html}
                 </div>
             </div>
             """, unsafe_allow_html=True)
-            try:
-                report_files = os.listdir("reports")
-                if report_files:
-                    latest_report = sorted(report_files)[-1]
-                    report_path = os.path.join("reports", latest_report)
-                    with open(report_path, "rb") as f:
-                        col_dl1, col_dl2, col_dl3 = st.columns([1, 2, 1])
-                        with col_dl2:
-                            st.download_button(
-                                label="Download Full Report (PDF)",
-                                data=f,
-                                file_name=latest_report,
-                                mime="application/pdf",
-                                use_container_width=True
-                            )
-            except:
-                pass
+
+    @staticmethod
+    def display_ai_analysis(user_input, prediction):
+        st.markdown("---")
+        UIComponents.display_section_header("AI-Powered Analysis")
+        st.session_state["user_input"] = user_input
+        st.session_state["prediction"] = prediction
+        stream = GeminiAI.start_analysis(user_input, prediction)
+        placeholder = st.empty()
+        if not stream.done():
+            placeholder.info("AI is analyzing your profile...")
+        streamed_response = ""
+        for chunk in stream.iter_chunks():
+            streamed_response += chunk
+            ResultsDisplayHandler.render_ai_response(placeholder, streamed_response)
+        ai_response, success = stream.result()
+        if success:
+            report_job = GeminiAI.request_report(user_input, prediction, ai_response)
+            ResultsDisplayHandler.display_report_download(report_job)
             ResultsDisplayHandler.display_follow_up_questions(user_input, prediction)
         else:
+            placeholder.empty()
             st.error(f"AI Analysis failed: {ai_response}")
 
+    @staticmethod
+    def display_report_download(report_job):
+        """Offer the PDF once its background job is done, polling with a fragment where supported"""
+        def render_download():
+            col_dl1, col_dl2, col_dl3 = st.columns([1, 2, 1])
+            with col_dl2:
+                if not report_job.done():
+                    st.info("Preparing your PDF report...")
+                    if not hasattr(st, "fragment"):
+                        st.button("Refresh Report Status", use_container_width=True, key="report_refresh_btn")
+                    return
+                if report_job.exception() is not None:
+                    st.warning("The PDF report could not be generated.")
+                    return
+                report_id = report_job.result()
+                report_data = PDFGenerator.store.get(report_id)
+                if report_data is None:
+                    st.warning("The PDF report has expired. Run the prediction again to regenerate it.")
+                    return
+                st.download_button(
+                    label="Download Full Report (PDF)",
+                    data=report_data,
+                    file_name=f"report_{report_id[:12]}.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+
+        if hasattr(st, "fragment") and not report_job.done():
+            @st.fragment(run_every=1)
+            def poll_report():
+                if report_job.done():
+                    st.rerun()
+                render_download()
+            poll_report()
+        else:
+            render_download()
+
     @staticmethod
     def display_follow_up_questions(user_input, prediction):
         UIComponents.display_section_header("Ask Follow-up Questions")
-        col_q1, col_q2, col_q3 = st.columns(3)
-        with col_q1:
-            if st.button("Academic Impact", use_container_width=True, key="academic_btn"):
-                with st.spinner("Thinking..."):
-                    follow_up = "How can I minimize social media's impact on my academic performance?"
-                    response, _ = GeminiAI.create_follow_up_query(user_input, prediction, follow_up)
-                    st.markdown(f"""
-                    <div class="ai-response" style="margin-top: 1rem;">
-                        <strong>Q:</strong> {follow_up}<br><br>
-                        <strong>AI:</strong> {response}
-                    </div>
-                    """, unsafe_allow_html=True)
-        with col_q2:
-            if st.button("Sleep & Usage", use_container_width=True, key="sleep_btn"):
-                with st.spinner("Thinking..."):
-                    follow_up = "How can I improve my sleep while managing social media use?"
-                    response, _ = GeminiAI.create_follow_up_query(user_input, prediction, follow_up)
-                    st.markdown(f"""
-                    <div class="ai-response" style="margin-top: 1rem;">
-                        <strong>Q:</strong> {follow_up}<br><br>
-                        <strong>AI:</strong> {response}
-                    </div>
-                    """, unsafe_allow_html=True)
-        with col_q3:
-            if st.button("Mental Health", use_container_width=True, key="mental_btn"):
-                with st.spinner("Thinking..."):
-                    follow_up = "What strategies can help improve my mental health related to social media use?"
-                    response, _ = GeminiAI.create_follow_up_query(user_input, prediction, follow_up)
-                    st.markdown(f"""
-                    <div class="ai-response" style="margin-top: 1rem;">
-                        <strong>Q:</strong> {follow_up}<br><br>
-                        <strong>AI:</strong> {response}
-                    </div>
-                    """, unsafe_allow_html=True)
+        follow_up_futures = None
+        if Config.GEMINI_PREFETCH_FOLLOW_UPS:
+            follow_up_futures = GeminiAI.prefetch_follow_ups(user_input, prediction)
+        button_keys = ["academic_btn", "sleep_btn", "mental_btn"]
+        for column, key, (label, follow_up) in zip(st.columns(3), button_keys, GeminiAI.PRESET_FOLLOW_UPS.items()):
+            with column:
+                if st.button(label, use_container_width=True, key=key):
+                    with st.spinner("Thinking..."):
+                        if follow_up_futures is not None:
+                            response, _ = follow_up_futures[follow_up].result()
+                        else:
+                            response, _ = GeminiAI.create_follow_up_query(user_input, prediction, follow_up)
+                        st.markdown(f"""
+                        <div class="ai-response" style="margin-top: 1rem;">
+                            <strong>Q:</strong> {follow_up}<br><br>
+                            <strong>AI:</strong> {response}
+                        </div>
+                        """, unsafe_allow_html=True)
         st.markdown("<br>", unsafe_allow_html=True)
         custom_question = st.text_input(
             "Ask your own question:",